@@ -3,24 +3,68 @@ Alert Management System
 Handles detection alerts, logging, and notifications
 """
 
+import asyncio
 import sqlite3
-import json
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Optional, Any, NamedTuple
+from dataclasses import dataclass, field
 import logging
 from enum import Enum
 import threading
-from queue import Queue
+from collections import OrderedDict, deque
+import orjson
+
+# SQLite 3.45+ stores JSON columns in its binary JSONB format, parsed once on insert.
+# Older libraries keep minified JSON text; json() reads either form back as text.
+JSON_ENCODE_SQL = "jsonb(?)" if sqlite3.sqlite_version_info >= (3, 45, 0) else "json(?)"
+
+# Built once so every batch hits the same entry in the connection's statement cache.
+# Upsert rather than INSERT OR REPLACE so a re-save updates the row in place and
+# the stats triggers see an UPDATE, not a new alert.
+INSERT_ALERT_SQL = f"""
+    INSERT INTO alerts 
+    (id, timestamp, camera_id, alert_level, confidence, detections, status, notes, frame_path)
+    VALUES (?, ?, ?, ?, ?, {JSON_ENCODE_SQL}, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        timestamp = excluded.timestamp,
+        camera_id = excluded.camera_id,
+        alert_level = excluded.alert_level,
+        confidence = excluded.confidence,
+        detections = excluded.detections,
+        status = excluded.status,
+        notes = excluded.notes,
+        frame_path = excluded.frame_path
+"""
+
+SELECT_ALERT_SQL = """
+    SELECT id, timestamp, camera_id, alert_level, confidence,
+           json(detections) AS detections, status, notes, frame_path
+    FROM alerts
+    WHERE id = ?
+"""
+
+# Recently created or looked-up alerts kept in memory for lookups by ID
+ALERT_CACHE_SIZE = 2048
+
+# Where an app notification alerts table found in this file is moved on startup
+LEGACY_APP_ALERTS_TABLE = "app_alerts_legacy"
+
+INSERT_LOG_SQL = f"""
+    INSERT INTO system_logs (timestamp, level, message, component, data)
+    VALUES (?, ?, ?, ?, {JSON_ENCODE_SQL})
+"""
 
 class AlertLevel(Enum):
     P1 = "P1"  # Immediate alert
     P2 = "P2"  # Review queue
     P4 = "P4"  # Log only
 
-@dataclass
+# Value -> member lookup, cheaper than calling AlertLevel(value) per row
+_LEVEL_CACHE = {level.value: level for level in AlertLevel}
+
+@dataclass(slots=True)
 class Alert:
     """Fire detection alert"""
     id: str
@@ -32,13 +76,40 @@ class Alert:
     status: str = "active"  # active, acknowledged, resolved
     notes: str = ""
     frame_path: Optional[str] = None  # Path to saved frame with bounding boxes
+    # Encoded detections, filled on first serialization. Detections are not
+    # modified after the alert is created, so the cached text stays valid.
+    _detections_json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def detections_json(self) -> str:
+        """Get detections encoded as JSON text, encoding at most once"""
+        if self._detections_json is None:
+            # bbox coordinates arrive as numpy integers from the detector
+            self._detections_json = orjson.dumps(
+                self.detections, option=orjson.OPT_SERIALIZE_NUMPY
+            ).decode()
+        return self._detections_json
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization"""
-        data = asdict(self)
-        data['alert_level'] = self.alert_level.value
-        data['detections'] = json.dumps(self.detections)
-        return data
+        return {
+            'id': self.id,
+            'timestamp': self.timestamp,
+            'camera_id': self.camera_id,
+            'alert_level': self.alert_level.value,
+            'confidence': self.confidence,
+            'detections': self.detections_json(),
+            'status': self.status,
+            'notes': self.notes,
+            'frame_path': self.frame_path
+        }
+    
+    def to_row(self) -> tuple:
+        """Convert to a parameter tuple for INSERT_ALERT_SQL"""
+        return (
+            self.id, self.timestamp, self.camera_id, self.alert_level.value,
+            self.confidence, self.detections_json(), self.status, self.notes,
+            self.frame_path
+        )
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Alert':
@@ -51,13 +122,34 @@ class Alert:
         
         # Convert field types
         clean_data['alert_level'] = AlertLevel(clean_data['alert_level'])
-        clean_data['detections'] = json.loads(clean_data['detections'])
+        clean_data['detections'] = orjson.loads(clean_data['detections'])
         
         # Handle optional frame_path
         if 'frame_path' not in clean_data:
             clean_data['frame_path'] = None
         
         return cls(**clean_data)
+    
+    @classmethod
+    def from_row(cls, row) -> 'Alert':
+        """Create from an alerts row selected in field order"""
+        alert = cls(
+            row[0], row[1], row[2], _LEVEL_CACHE[row[3]], row[4],
+            orjson.loads(row[5]), row[6], row[7], row[8]
+        )
+        # The row already holds the encoded detections
+        alert._detections_json = row[5]
+        return alert
+
+class AlertRow(NamedTuple):
+    """Dashboard summary of an alert, without detection details"""
+    id: str
+    timestamp: float
+    camera_id: str
+    alert_level: str
+    confidence: float
+    status: str
+    has_frame: bool
 
 class AlertDatabase:
     """SQLite database for storing alerts and system logs"""
@@ -66,11 +158,59 @@ class AlertDatabase:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True)
         self.logger = logging.getLogger(__name__)
+        self._local = threading.local()
+        # System events waiting to be written, flushed by the alert thread
+        self._log_buffer = deque()
+        # Caps concurrent async reads, each of which holds an executor thread
+        self._async_slots = asyncio.Semaphore(16)
         self._init_database()
     
+    def _get_conn(self) -> sqlite3.Connection:
+        """Get this thread's long-lived connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode - multi-statement writes use explicit BEGIN/COMMIT
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                                   cached_statements=256)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")
+            conn.execute("PRAGMA busy_timeout=5000")
+            # Serve dashboard reads straight from the mapped file rather than copying pages
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._local.conn = conn
+        return conn
+    
+    def close(self):
+        """Flush buffered system events and close the calling thread's connection"""
+        self.flush_system_events()
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+    
     def _init_database(self):
         """Initialize database tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        conn = self._get_conn()
+        
+        # WAL lets dashboard reads run alongside the alert threads' writes.
+        # The journal mode is stored in the file, so setting it once is enough.
+        if str(self.db_path) != ':memory:':
+            conn.execute("PRAGMA journal_mode=WAL")
+        
+        conn.execute("BEGIN")
+        try:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(alerts)")}
+            if 'alert_id' in columns:
+                # The app notification store's table from when both stores shared this
+                # file; move it aside so AppNotificationManager can copy it out
+                conn.execute(f"ALTER TABLE alerts RENAME TO {LEGACY_APP_ALERTS_TABLE}")
+                self.logger.warning(f"Moved app notification alerts in {self.db_path} "
+                                    f"to {LEGACY_APP_ALERTS_TABLE}")
+                columns = set()
+            if columns and not {'id', 'alert_level', 'status'} <= columns:
+                raise RuntimeError(f"alerts table in {self.db_path} has an unexpected layout")
+            
             # Alerts table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS alerts (
@@ -87,6 +227,10 @@ class AlertDatabase:
                 )
             """)
             
+            # Indexes for the time-window and status filters used by the dashboard
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_ts ON alerts(timestamp DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_status_ts ON alerts(status, timestamp DESC)")
+            
             # System logs table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS system_logs (
@@ -99,6 +243,7 @@ class AlertDatabase:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_syslogs_ts ON system_logs(timestamp)")
             
             # Performance metrics table
             conn.execute("""
@@ -113,104 +258,270 @@ class AlertDatabase:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_metrics_ts ON performance_metrics(timestamp)")
             
-            conn.commit()
+            self._init_stats_rollup(conn)
+            
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    
+    def _init_stats_rollup(self, conn: sqlite3.Connection):
+        """Create the hourly per-level rollup that backs get_alert_statistics"""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'alert_stats_hourly'"
+        ).fetchone()
+        
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS alert_stats_hourly (
+                hour_bucket INTEGER NOT NULL,
+                alert_level TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                sum_conf REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (hour_bucket, alert_level)
+            )
+        """)
+        
+        # Triggers keep the rollup in step with every write path, including
+        # re-saving an existing alert once its frame has been stored
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_alert_stats_insert AFTER INSERT ON alerts
+            BEGIN
+                INSERT INTO alert_stats_hourly (hour_bucket, alert_level, count, sum_conf)
+                VALUES (CAST(NEW.timestamp / 3600 AS INTEGER), NEW.alert_level, 1, NEW.confidence)
+                ON CONFLICT(hour_bucket, alert_level) DO UPDATE SET
+                    count = count + 1,
+                    sum_conf = sum_conf + excluded.sum_conf;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_alert_stats_delete AFTER DELETE ON alerts
+            BEGIN
+                UPDATE alert_stats_hourly
+                SET count = count - 1, sum_conf = sum_conf - OLD.confidence
+                WHERE hour_bucket = CAST(OLD.timestamp / 3600 AS INTEGER)
+                  AND alert_level = OLD.alert_level;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_alert_stats_update
+            AFTER UPDATE OF timestamp, alert_level, confidence ON alerts
+            BEGIN
+                UPDATE alert_stats_hourly
+                SET count = count - 1, sum_conf = sum_conf - OLD.confidence
+                WHERE hour_bucket = CAST(OLD.timestamp / 3600 AS INTEGER)
+                  AND alert_level = OLD.alert_level;
+                INSERT INTO alert_stats_hourly (hour_bucket, alert_level, count, sum_conf)
+                VALUES (CAST(NEW.timestamp / 3600 AS INTEGER), NEW.alert_level, 1, NEW.confidence)
+                ON CONFLICT(hour_bucket, alert_level) DO UPDATE SET
+                    count = count + 1,
+                    sum_conf = sum_conf + excluded.sum_conf;
+            END
+        """)
+        
+        if not exists:
+            # Backfill from alerts recorded before the rollup existed
+            conn.execute("""
+                INSERT INTO alert_stats_hourly (hour_bucket, alert_level, count, sum_conf)
+                SELECT CAST(timestamp / 3600 AS INTEGER), alert_level, COUNT(*), SUM(confidence)
+                FROM alerts
+                GROUP BY 1, 2
+            """)
     
     def save_alert(self, alert: Alert) -> bool:
         """Save alert to database"""
+        return self.save_alerts([alert])
+    
+    def save_alerts(self, alerts: List[Alert]) -> bool:
+        """Save a batch of alerts in a single transaction"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                data = alert.to_dict()
-                conn.execute("""
-                    INSERT OR REPLACE INTO alerts 
-                    (id, timestamp, camera_id, alert_level, confidence, detections, status, notes, frame_path)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    data['id'], data['timestamp'], data['camera_id'], 
-                    data['alert_level'], data['confidence'], data['detections'],
-                    data['status'], data['notes'], data.get('frame_path')
-                ))
-                conn.commit()
+            rows = [alert.to_row() for alert in alerts]
+            
+            conn = self._get_conn()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(INSERT_ALERT_SQL, rows)
+                # System events share the commit, one fsync covers both
+                self._write_buffered_events(conn)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
             return True
         except Exception as e:
-            self.logger.error(f"Failed to save alert: {e}")
+            self.logger.error(f"Failed to save alerts: {e}")
             return False
     
     def get_recent_alerts(self, hours: int = 24, limit: int = 100) -> List[Alert]:
         """Get recent alerts"""
         cutoff = time.time() - (hours * 3600)
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT * FROM alerts 
-                WHERE timestamp > ? 
-                ORDER BY timestamp DESC 
-                LIMIT ?
-            """, (cutoff, limit))
-            
-            alerts = []
-            for row in cursor:
-                alert_data = dict(row)
-                alerts.append(Alert.from_dict(alert_data))
-            
-            return alerts
+        cursor = self._get_conn().execute("""
+            SELECT id, timestamp, camera_id, alert_level, confidence,
+                   json(detections) AS detections, status, notes, frame_path
+            FROM alerts 
+            WHERE timestamp > ? 
+            ORDER BY timestamp DESC 
+            LIMIT ?
+        """, (cutoff, limit))
+        
+        return [Alert.from_row(row) for row in cursor]
+    
+    def get_alert(self, alert_id: str) -> Optional[Alert]:
+        """Get a single alert by ID"""
+        row = self._get_conn().execute(SELECT_ALERT_SQL, (alert_id,)).fetchone()
+        return Alert.from_row(row) if row else None
+    
+    async def run_in_thread(self, func, *args, **kwargs):
+        """Run a database call on a worker thread (with its own connection) off the event loop
+        
+        Concurrent calls are capped so async readers can't exhaust the default executor.
+        """
+        async with self._async_slots:
+            return await asyncio.to_thread(func, *args, **kwargs)
+    
+    async def aget_recent_alerts(self, hours: int = 24, limit: int = 100) -> List[Alert]:
+        """Async version of get_recent_alerts"""
+        return await self.run_in_thread(self.get_recent_alerts, hours, limit)
+    
+    async def aget_alert(self, alert_id: str) -> Optional[Alert]:
+        """Async version of get_alert"""
+        return await self.run_in_thread(self.get_alert, alert_id)
+    
+    async def aget_alert_statistics(self, hours: int = 24) -> Dict[str, Any]:
+        """Async version of get_alert_statistics"""
+        return await self.run_in_thread(self.get_alert_statistics, hours)
+    
+    def get_alert_summaries(self, hours: int = 24, limit: int = 50) -> List[AlertRow]:
+        """Get recent alerts as lightweight dashboard rows, without detection details"""
+        cutoff = time.time() - (hours * 3600)
+        
+        cursor = self._get_conn().execute("""
+            SELECT id, timestamp, camera_id, alert_level, confidence, status,
+                   frame_path IS NOT NULL AS has_frame
+            FROM alerts 
+            WHERE timestamp > ? 
+            ORDER BY timestamp DESC 
+            LIMIT ?
+        """, (cutoff, limit))
+        
+        return [
+            AlertRow(row[0], row[1], row[2], row[3], row[4], row[5], bool(row[6]))
+            for row in cursor
+        ]
+    
+    def get_last_detection_time(self, hours: int = 24) -> Optional[float]:
+        """Get the timestamp of the most recent alert within the time window"""
+        cutoff = time.time() - (hours * 3600)
+        return self._get_conn().execute(
+            "SELECT MAX(timestamp) FROM alerts WHERE timestamp > ?", (cutoff,)
+        ).fetchone()[0]
     
     def get_alert_statistics(self, hours: int = 24) -> Dict[str, Any]:
-        """Get alert statistics for dashboard"""
+        """Get alert statistics for dashboard over the same window as the alert lists
+        
+        Whole hours come from the rollup table; the partial hour the window starts
+        in is counted from the alerts themselves, so the cutoff is exact.
+        """
         cutoff = time.time() - (hours * 3600)
+        cutoff_bucket = int(cutoff // 3600)
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT 
-                    alert_level,
-                    COUNT(*) as count,
-                    AVG(confidence) as avg_confidence
-                FROM alerts 
-                WHERE timestamp > ? 
-                GROUP BY alert_level
-            """, (cutoff,))
-            
-            stats = {}
-            for row in cursor:
-                level, count, avg_conf = row
-                stats[level] = {
-                    'count': count,
-                    'avg_confidence': round(avg_conf, 3)
-                }
-            
-            # Get total count
-            cursor = conn.execute("""
-                SELECT COUNT(*) FROM alerts WHERE timestamp > ?
-            """, (cutoff,))
-            total = cursor.fetchone()[0]
-            
-            stats['total'] = total
-            stats['time_range_hours'] = hours
-            
-            return stats
+        cursor = self._get_conn().execute("""
+            SELECT 
+                alert_level,
+                SUM(count) as count,
+                SUM(sum_conf) / SUM(count) as avg_confidence
+            FROM (
+                SELECT alert_level, count, sum_conf
+                FROM alert_stats_hourly
+                WHERE hour_bucket > ?
+                UNION ALL
+                SELECT alert_level, 1, confidence
+                FROM alerts
+                WHERE timestamp > ? AND timestamp < ?
+            )
+            GROUP BY alert_level
+            HAVING SUM(count) > 0
+        """, (cutoff_bucket, cutoff, (cutoff_bucket + 1) * 3600))
+        
+        stats = {}
+        total = 0
+        for row in cursor:
+            level, count, avg_conf = row
+            stats[level] = {
+                'count': count,
+                'avg_confidence': round(avg_conf, 3)
+            }
+            total += count
+        
+        stats['total'] = total
+        stats['time_range_hours'] = hours
+        
+        return stats
+    
+    def get_active_alert_count(self, hours: int = 24) -> int:
+        """Count alerts still in 'active' status within the time window"""
+        cutoff = time.time() - (hours * 3600)
+        
+        cursor = self._get_conn().execute("""
+            SELECT COUNT(*) FROM alerts WHERE status = 'active' AND timestamp > ?
+        """, (cutoff,))
+        return cursor.fetchone()[0]
     
     def log_system_event(self, level: str, message: str, component: str = None, data: Dict = None):
-        """Log system event"""
+        """Log system event - buffered and written with the next alert batch or flush"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT INTO system_logs (timestamp, level, message, component, data)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    time.time(), level, message, component,
-                    json.dumps(data) if data else None
-                ))
-                conn.commit()
+            self._log_buffer.append((
+                time.time(), level, message, component,
+                orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode() if data else None
+            ))
         except Exception as e:
             self.logger.error(f"Failed to log system event: {e}")
     
+    def _write_buffered_events(self, conn: sqlite3.Connection):
+        """Insert buffered system events within the caller's transaction"""
+        rows = []
+        while True:
+            try:
+                rows.append(self._log_buffer.popleft())
+            except IndexError:
+                break
+        if rows:
+            conn.executemany(INSERT_LOG_SQL, rows)
+    
+    def flush_system_events(self):
+        """Write any buffered system events in their own transaction"""
+        if not self._log_buffer:
+            return
+        
+        try:
+            conn = self._get_conn()
+            conn.execute("BEGIN")
+            try:
+                self._write_buffered_events(conn)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except Exception as e:
+            self.logger.error(f"Failed to log system events: {e}")
+    
     def cleanup_old_records(self, retention_days: int = 30):
         """Clean up old records"""
         cutoff = time.time() - (retention_days * 24 * 3600)
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            conn = self._get_conn()
+            # Take the write lock up front so the deletes can't fail midway on a
+            # read-to-write lock upgrade while the alert thread is writing
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Drop expired rollup buckets first so the delete trigger has
+                # nothing to update for them
+                conn.execute("DELETE FROM alert_stats_hourly WHERE hour_bucket < ?",
+                             (int(cutoff // 3600),))
+                
                 # Clean alerts
                 cursor = conn.execute("DELETE FROM alerts WHERE timestamp < ?", (cutoff,))
                 alerts_deleted = cursor.rowcount
@@ -223,10 +534,13 @@ class AlertDatabase:
                 cursor = conn.execute("DELETE FROM performance_metrics WHERE timestamp < ?", (cutoff,))
                 metrics_deleted = cursor.rowcount
                 
-                conn.commit()
-                
-                self.logger.info(f"Cleanup: {alerts_deleted} alerts, {logs_deleted} logs, {metrics_deleted} metrics")
-                
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            
+            self.logger.info(f"Cleanup: {alerts_deleted} alerts, {logs_deleted} logs, {metrics_deleted} metrics")
+            
         except Exception as e:
             self.logger.error(f"Failed to cleanup old records: {e}")
 
@@ -238,17 +552,24 @@ class AlertManager:
         self.database = AlertDatabase()
         self.logger = logging.getLogger(__name__)
         
-        # Alert queue for processing
-        self.alert_queue = Queue()
-        self.notification_queue = Queue()
+        # Alert queue for processing - deque appends/pops are atomic, and the
+        # event wakes the writer once per burst rather than once per alert
+        self.alert_queue = deque()
+        self.alert_event = threading.Event()
+        self.max_batch_size = 64
+        
+        # Last millisecond stamp issued per camera, keeps alert IDs unique
+        self._last_alert_ms: Dict[str, int] = {}
+        self._alert_id_lock = threading.Lock()
+        
+        # alert_id -> Alert, most recently used last; filled as alerts are created
+        self._alert_cache: OrderedDict[str, Alert] = OrderedDict()
+        self._alert_cache_lock = threading.Lock()
         
-        # Start processing threads
+        # Start processing thread - it also dispatches notifications once a batch is saved
         self.is_running = True
         self.alert_thread = threading.Thread(target=self._process_alerts, daemon=True)
-        self.notification_thread = threading.Thread(target=self._process_notifications, daemon=True)
-        
         self.alert_thread.start()
-        self.notification_thread.start()
         
         self.logger.info("Alert Manager initialized")
     
@@ -257,8 +578,7 @@ class AlertManager:
         if detection_result.alert_level == 'None':
             return None
         
-        # Generate unique alert ID
-        alert_id = f"{camera_id}_{int(time.time() * 1000)}"
+        alert_id = self._next_alert_id(camera_id)
         
         # Convert detections to serializable format
         detections = []
@@ -279,50 +599,97 @@ class AlertManager:
             detections=detections
         )
         
+        self._cache_alert(alert)
+        
         # Queue alert for processing
-        self.alert_queue.put(alert)
+        self.alert_queue.append(alert)
+        self.alert_event.set()
         
         return alert
     
+    def _next_alert_id(self, camera_id: str) -> str:
+        """Generate a unique alert ID from a per-camera monotonic millisecond stamp"""
+        with self._alert_id_lock:
+            # Two detections in the same millisecond would otherwise share an ID
+            # and the second would overwrite the first on save
+            stamp = max(int(time.time() * 1000), self._last_alert_ms.get(camera_id, 0) + 1)
+            self._last_alert_ms[camera_id] = stamp
+        return f"{camera_id}_{stamp}"
+    
+    def _cache_alert(self, alert: Alert):
+        """Remember an alert for get_alert, evicting the least recently used"""
+        with self._alert_cache_lock:
+            self._alert_cache[alert.id] = alert
+            self._alert_cache.move_to_end(alert.id)
+            if len(self._alert_cache) > ALERT_CACHE_SIZE:
+                self._alert_cache.popitem(last=False)
+    
+    def get_alert(self, alert_id: str) -> Optional[Alert]:
+        """Get an alert by ID from memory, falling back to a primary-key lookup"""
+        with self._alert_cache_lock:
+            alert = self._alert_cache.get(alert_id)
+            if alert is not None:
+                self._alert_cache.move_to_end(alert_id)
+                return alert
+        
+        alert = self.database.get_alert(alert_id)
+        if alert is not None:
+            self._cache_alert(alert)
+        return alert
+    
+    async def aget_alert(self, alert_id: str) -> Optional[Alert]:
+        """Async version of get_alert; only a cache miss goes to a worker thread"""
+        with self._alert_cache_lock:
+            alert = self._alert_cache.get(alert_id)
+        if alert is not None:
+            return alert
+        return await self.database.run_in_thread(self.get_alert, alert_id)
+    
     def _process_alerts(self):
         """Process alerts in background thread"""
         while self.is_running:
-            try:
-                alert = self.alert_queue.get(timeout=1)
-                
-                # Save to database
-                if self.database.save_alert(alert):
-                    self.logger.info(f"Alert saved: {alert.id} ({alert.alert_level.value})")
-                    
-                    # Queue for notifications
-                    self.notification_queue.put(alert)
-                
-                self.alert_queue.task_done()
+            # Time out periodically so stop() is noticed and idle-time
+            # system events still reach the database
+            if not self.alert_event.wait(timeout=1):
+                self.database.flush_system_events()
+                continue
+            self.alert_event.clear()
+            
+            # Drain the whole burst, writing up to max_batch_size alerts per transaction
+            while self.alert_queue:
+                batch = []
+                while len(batch) < self.max_batch_size:
+                    try:
+                        batch.append(self.alert_queue.popleft())
+                    except IndexError:
+                        break
                 
-            except Exception as e:
-                import queue
-                if not isinstance(e, queue.Empty):
+                try:
+                    # Save to database
+                    if self.database.save_alerts(batch):
+                        for alert in batch:
+                            self.logger.info(f"Alert saved: {alert.id} ({alert.alert_level.value})")
+                            
+                            self._dispatch_notification(alert)
+                        
+                        # Write the events the notifications just logged
+                        self.database.flush_system_events()
+                except Exception as e:
                     self.logger.error(f"Error processing alert: {e}")
+        
+        # Flush events logged during the final batch and release this thread's connection
+        self.database.close()
     
-    def _process_notifications(self):
-        """Process notifications in background thread"""
-        while self.is_running:
-            try:
-                alert = self.notification_queue.get(timeout=1)
-                
-                # Send notifications based on alert level
-                if alert.alert_level == AlertLevel.P1:
-                    self._send_immediate_notification(alert)
-                elif alert.alert_level == AlertLevel.P2:
-                    self._send_review_notification(alert)
-                # P4 alerts are just logged
-                
-                self.notification_queue.task_done()
-                
-            except Exception as e:
-                import queue
-                if not isinstance(e, queue.Empty):
-                    self.logger.error(f"Error processing notification: {e}")
+    def _dispatch_notification(self, alert: Alert):
+        """Send notifications for a saved alert based on its level"""
+        try:
+            if alert.alert_level == AlertLevel.P1:
+                self._send_immediate_notification(alert)
+            elif alert.alert_level == AlertLevel.P2:
+                self._send_review_notification(alert)
+            # P4 alerts are just logged
+        except Exception as e:
+            self.logger.error(f"Error processing notification: {e}")
     
     def _send_immediate_notification(self, alert: Alert):
         """Send immediate notification for P1 alerts"""
@@ -354,43 +721,38 @@ class AlertManager:
     
     def get_dashboard_data(self, total_cameras: int = 0) -> Dict[str, Any]:
         """Get data for dashboard display"""
-        recent_alerts = self.database.get_recent_alerts(hours=24, limit=50)
-        alert_stats = self.database.get_alert_statistics(hours=24)
-        
         return {
             'recent_alerts': [
-                {
-                    'id': alert.id,
-                    'timestamp': alert.timestamp,
-                    'camera_id': alert.camera_id,
-                    'alert_level': alert.alert_level.value,
-                    'confidence': alert.confidence,
-                    'status': alert.status,
-                    'has_frame': alert.frame_path is not None
-                }
-                for alert in recent_alerts
+                row._asdict() for row in self.database.get_alert_summaries(hours=24, limit=50)
             ],
-            'statistics': alert_stats,
+            'statistics': self.database.get_alert_statistics(hours=24),
             'system_status': {
                 'total_cameras': total_cameras,
-                'active_alerts': len([a for a in recent_alerts if a.status == 'active']),
-                'last_detection': recent_alerts[0].timestamp if recent_alerts else None
+                'active_alerts': self.database.get_active_alert_count(hours=24),
+                'last_detection': self.database.get_last_detection_time(hours=24)
             }
         }
     
+    async def aget_dashboard_data(self, total_cameras: int = 0) -> Dict[str, Any]:
+        """Async version of get_dashboard_data"""
+        return await self.database.run_in_thread(self.get_dashboard_data, total_cameras)
+    
     def acknowledge_alert(self, alert_id: str, notes: str = "") -> bool:
         """Acknowledge an alert"""
         try:
-            with sqlite3.connect(self.database.db_path) as conn:
-                cursor = conn.execute("""
-                    UPDATE alerts 
-                    SET status = 'acknowledged', notes = ?
-                    WHERE id = ?
-                """, (notes, alert_id))
-                rows_affected = cursor.rowcount
-                conn.commit()
+            cursor = self.database._get_conn().execute("""
+                UPDATE alerts 
+                SET status = 'acknowledged', notes = ?
+                WHERE id = ?
+            """, (notes, alert_id))
+            rows_affected = cursor.rowcount
             
             if rows_affected > 0:
+                with self._alert_cache_lock:
+                    cached = self._alert_cache.get(alert_id)
+                if cached is not None:
+                    cached.status = 'acknowledged'
+                    cached.notes = notes
                 self.logger.info(f"Alert acknowledged: {alert_id}")
                 return True
             else:
@@ -404,6 +766,9 @@ class AlertManager:
     def stop(self):
         """Stop the alert manager"""
         self.is_running = False
+        self.alert_event.set()
+        self.alert_thread.join(timeout=5)
+        self.database.close()
         self.logger.info("Alert Manager stopped")
 
 # Global alert manager instance
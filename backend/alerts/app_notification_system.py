@@ -7,17 +7,123 @@ import json
 import logging
 import threading
 import time
-from typing import Dict, List, Optional, Callable
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Callable, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 import cv2
 import numpy as np
-from queue import Queue, Empty
+from collections import Counter, OrderedDict, deque
 import sqlite3
-import base64
 
-@dataclass
+try:
+    # SIMD-accelerated drop-in for the stdlib module
+    import pybase64 as base64
+    # Not every build exposes the SIMD probe; the C extension keeps it in _pybase64
+    _get_simd_path = (getattr(base64, 'get_simd_path', None)
+                      or getattr(getattr(base64, '_pybase64', None), 'get_simd_path', None))
+    logging.getLogger(__name__).debug(
+        f"Using pybase64 {base64.get_version()}, SIMD path: "
+        f"{_get_simd_path() if _get_simd_path else 'unavailable (no C extension)'}"
+    )
+except ImportError:
+    import base64
+
+try:
+    from .alert_manager import LEGACY_APP_ALERTS_TABLE
+except ImportError:
+    from alerts.alert_manager import LEGACY_APP_ALERTS_TABLE
+
+try:
+    # libjpeg-turbo's SIMD encoder, noticeably faster than OpenCV's bundled libjpeg
+    from turbojpeg import TurboJPEG
+    _turbo_jpeg = TurboJPEG()
+except Exception:
+    # Package missing or the shared library could not be loaded
+    _turbo_jpeg = None
+
+# Hot-path statements, kept as constants so each call reuses the same
+# entry in the connection's statement cache
+INSERT_ALERT_SQL = """
+    INSERT INTO alerts (
+        alert_id, alert_type, camera_id, message, confidence,
+        timestamp, location, frame_path, acknowledged,
+        acknowledged_by, acknowledged_at, image_data
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(alert_id) DO NOTHING
+"""
+
+UPSERT_STAT_SQL = """
+    INSERT INTO alert_stats (hour_key, day_key, alert_type, count)
+    VALUES (?, ?, ?, 1)
+    ON CONFLICT(hour_key, day_key, alert_type) DO UPDATE SET count = count + 1
+"""
+
+SELECT_RECENT_SQL = """
+    SELECT alert_id, alert_type, camera_id, message, confidence, timestamp,
+           location, acknowledged, acknowledged_by, acknowledged_at
+    FROM alerts 
+    WHERE timestamp > ? 
+    ORDER BY timestamp DESC 
+    LIMIT ?
+"""
+
+SELECT_ALERT_SQL = """
+    SELECT alert_id, alert_type, camera_id, message, confidence, timestamp,
+           location, acknowledged, acknowledged_by, acknowledged_at, NULL
+    FROM alerts
+    WHERE alert_id = ?
+"""
+
+SELECT_ALERT_WITH_IMAGE_SQL = """
+    SELECT alert_id, alert_type, camera_id, message, confidence, timestamp,
+           location, acknowledged, acknowledged_by, acknowledged_at, image_data
+    FROM alerts
+    WHERE alert_id = ?
+"""
+
+ACK_ALERT_SQL = """
+    UPDATE alerts 
+    SET acknowledged = TRUE,
+        acknowledged_by = ?,
+        acknowledged_at = ?
+    WHERE alert_id = ?
+"""
+
+UNACK_COUNT_SQL = """
+    SELECT alert_type, COUNT(*) as count
+    FROM alerts
+    WHERE acknowledged = FALSE
+    GROUP BY alert_type
+"""
+
+# Today, last 7 days, unacknowledged and total in one round trip
+ALERT_STATS_SQL = """
+    SELECT 'today', alert_type, SUM(count) FROM alert_stats
+    WHERE day_key = ? GROUP BY alert_type
+    UNION ALL
+    SELECT 'week', alert_type, SUM(count) FROM alert_stats
+    WHERE day_key >= ? GROUP BY alert_type
+    UNION ALL
+    SELECT 'unack', alert_type, COUNT(*) FROM alerts
+    WHERE acknowledged = FALSE GROUP BY alert_type
+    UNION ALL
+    SELECT 'total', '', COUNT(*) FROM alerts
+"""
+
+# Bumped whenever _init_database has to rebuild the alerts table
+SCHEMA_VERSION = 1
+
+def _timestamp_us(value: datetime) -> int:
+    """Convert a datetime to integer epoch microseconds for storage"""
+    return int(value.timestamp() * 1_000_000)
+
+def _from_timestamp_us(value: int) -> datetime:
+    """Convert stored epoch microseconds back to a local datetime"""
+    return datetime.fromtimestamp(value // 1_000_000).replace(microsecond=value % 1_000_000)
+
+@dataclass(slots=True, frozen=True)
 class AlertMessage:
     """Alert message structure"""
     alert_id: str
@@ -31,15 +137,28 @@ class AlertMessage:
     acknowledged: bool = False
     acknowledged_by: Optional[str] = None
     acknowledged_at: Optional[datetime] = None
+    _dict_cache: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
     
-    def to_dict(self) -> Dict:
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        if self.acknowledged_at:
-            data['acknowledged_at'] = self.acknowledged_at.isoformat()
-        if self.image_data:
+    def to_dict(self, include_image: bool = True) -> Dict:
+        if self._dict_cache is None:
+            # Alerts are immutable, so the serialized fields only need building once
+            object.__setattr__(self, '_dict_cache', {
+                'alert_id': self.alert_id,
+                'alert_type': self.alert_type,
+                'camera_id': self.camera_id,
+                'message': self.message,
+                'confidence': self.confidence,
+                'timestamp': self.timestamp.isoformat(),
+                'image_data': None,
+                'location': self.location,
+                'acknowledged': self.acknowledged,
+                'acknowledged_by': self.acknowledged_by,
+                'acknowledged_at': self.acknowledged_at.isoformat() if self.acknowledged_at else None
+            })
+        data = dict(self._dict_cache)
+        if include_image and self.image_data:
             # Convert image data to base64 for JSON serialization
-            data['image_data'] = base64.b64encode(self.image_data).decode('utf-8')
+            data['image_data'] = base64.b64encode(self.image_data).decode('ascii')
         return data
     
     @classmethod
@@ -70,47 +189,105 @@ class AppAlertConfig:
     sound_enabled: bool = True
     
     # Persistence
-    database_path: str = "data/alerts.db"
+    # Separate from the alert manager's data/alerts.db, whose alerts table has a different layout
+    database_path: str = "data/app_alerts.db"
+    # Shared file app alerts were kept in before; copied into database_path on first start
+    legacy_database_path: str = "data/alerts.db"
     alert_frames_dir: str = "data/alert_frames"
 
 class AlertDatabase:
     """Local alert storage and management"""
     
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, legacy_db_path: Optional[str] = None):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.legacy_db_path = Path(legacy_db_path) if legacy_db_path else None
         self.logger = logging.getLogger(__name__)
+        self._local = threading.local()
+        
+        # Short-lived cache for dashboard polling; entries from an older
+        # write generation are treated as misses
+        self._read_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_ttl = 1.0
+        self._cache_size = 16
+        self._generation = 0
+        
         self._init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection tuned for the alert write path"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=64)
+        conn.row_factory = sqlite3.Row
+        # WAL lets stats readers run alongside the writer; NORMAL skips the per-commit fsync
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA cache_size=-20000")
+        return conn
+    
+    def _get_conn(self) -> sqlite3.Connection:
+        """Get this thread's long-lived connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+    
+    def close(self):
+        """Close the calling thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+    
+    def _cache_get(self, key):
+        """Return a cached read result, or None if missing, expired or stale"""
+        with self._cache_lock:
+            entry = self._read_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, generation, value = entry
+            if generation != self._generation or time.monotonic() - stored_at > self._cache_ttl:
+                del self._read_cache[key]
+                return None
+            self._read_cache.move_to_end(key)
+            return value
+    
+    def _cache_put(self, key, value, generation: int):
+        """Cache a read result computed at the given write generation"""
+        with self._cache_lock:
+            self._read_cache[key] = (time.monotonic(), generation, value)
+            self._read_cache.move_to_end(key)
+            while len(self._read_cache) > self._cache_size:
+                self._read_cache.popitem(last=False)
+    
+    def _invalidate_cache(self):
+        """Mark every cached read as stale after a committed write"""
+        with self._cache_lock:
+            self._generation += 1
+    
     def _init_database(self):
         """Initialize SQLite database for alert storage"""
+        conn = self._get_conn()
+        legacy_table = self._attach_legacy_database(conn)
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # Main alerts table
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS alerts (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        alert_id TEXT UNIQUE NOT NULL,
-                        alert_type TEXT NOT NULL,
-                        camera_id TEXT NOT NULL,
-                        message TEXT NOT NULL,
-                        confidence REAL NOT NULL,
-                        timestamp TIMESTAMP NOT NULL,
-                        location TEXT,
-                        frame_path TEXT,
-                        acknowledged BOOLEAN DEFAULT FALSE,
-                        acknowledged_by TEXT,
-                        acknowledged_at TIMESTAMP,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        data JSON
-                    )
-                """)
-                
-                # Indexes for performance
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_timestamp ON alerts(timestamp DESC)")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_type ON alerts(alert_type)")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_camera ON alerts(camera_id)")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_acknowledged ON alerts(acknowledged)")
+            with conn:
+                conn.execute("BEGIN")
+                
+                if legacy_table:
+                    self._copy_legacy_alerts(conn, legacy_table)
+                
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(alerts)")}
+                if columns and 'alert_id' not in columns:
+                    raise RuntimeError(f"alerts table in {self.db_path} has an unexpected layout")
+                if version < SCHEMA_VERSION and 'alert_id' in columns:
+                    self._migrate_alerts_table(conn, columns)
+                else:
+                    self._create_alerts_table(conn)
                 
                 # Alert statistics table
                 conn.execute("""
@@ -123,156 +300,337 @@ class AlertDatabase:
                         UNIQUE(hour_key, day_key, alert_type)
                     )
                 """)
+                if legacy_table:
+                    self._copy_legacy_stats(conn)
                 
-                conn.commit()
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         except Exception as e:
             self.logger.error(f"Failed to initialize alert database: {e}")
+            raise
+        finally:
+            if legacy_table:
+                conn.execute("DETACH DATABASE legacy")
+    
+    def _attach_legacy_database(self, conn: sqlite3.Connection) -> Optional[str]:
+        """Attach the old shared alerts file if this store's own file is still empty
+        
+        Returns the legacy table holding app alerts, or None if there is nothing to copy.
+        """
+        if (self.legacy_db_path is None or not self.legacy_db_path.exists()
+                or self.legacy_db_path.resolve() == self.db_path.resolve()):
+            return None
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'alerts'").fetchone():
+            return None
+        
+        # ATTACH can't run inside a transaction, so this happens before BEGIN
+        conn.execute("ATTACH DATABASE ? AS legacy", (str(self.legacy_db_path),))
+        # AlertManager moves the table aside when it finds it in its own file
+        for table in ('alerts', LEGACY_APP_ALERTS_TABLE):
+            columns = {row[1] for row in conn.execute(f"PRAGMA legacy.table_info({table})")}
+            if 'alert_id' in columns:
+                return table
+        conn.execute("DETACH DATABASE legacy")
+        return None
+    
+    def _copy_legacy_alerts(self, conn: sqlite3.Connection, legacy_table: str):
+        """Copy app alerts out of the attached legacy file, leaving that file untouched
+        
+        The copy keeps the legacy layout; _init_database then migrates it like any
+        unversioned table.
+        """
+        conn.execute(f"CREATE TABLE alerts AS SELECT * FROM legacy.{legacy_table}")
+        count = conn.execute("SELECT COUNT(*) FROM alerts").fetchone()[0]
+        self.logger.info(f"Copied {count} alerts from {self.legacy_db_path}")
+    
+    def _copy_legacy_stats(self, conn: sqlite3.Connection):
+        """Copy hourly alert counts out of the attached legacy file, if it has them"""
+        columns = {row[1] for row in conn.execute("PRAGMA legacy.table_info(alert_stats)")}
+        if {'hour_key', 'day_key', 'alert_type', 'count'} <= columns:
+            conn.execute("""
+                INSERT OR IGNORE INTO alert_stats (hour_key, day_key, alert_type, count)
+                SELECT hour_key, day_key, alert_type, count FROM legacy.alert_stats
+            """)
+    
+    def _create_alerts_table(self, conn: sqlite3.Connection):
+        """Create the alerts table and its indexes"""
+        # Main alerts table - keyed directly on alert_id, timestamps in epoch microseconds
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS alerts (
+                alert_id TEXT PRIMARY KEY,
+                alert_type TEXT NOT NULL,
+                camera_id TEXT NOT NULL,
+                message TEXT NOT NULL,
+                confidence REAL NOT NULL,
+                timestamp INTEGER NOT NULL,
+                location TEXT,
+                frame_path TEXT,
+                acknowledged BOOLEAN DEFAULT FALSE,
+                acknowledged_by TEXT,
+                acknowledged_at TIMESTAMP,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                data JSON,
+                image_data BLOB
+            ) WITHOUT ROWID
+        """)
+        
+        # Indexes for performance
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_timestamp ON alerts(timestamp DESC)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_type ON alerts(alert_type)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_camera ON alerts(camera_id)")
+        # Only unacknowledged rows are ever filtered on, so index just those
+        conn.execute("DROP INDEX IF EXISTS idx_alerts_acknowledged")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_unack ON alerts(alert_type) WHERE acknowledged = FALSE")
+    
+    def _migrate_alerts_table(self, conn: sqlite3.Connection, columns: set):
+        """Rebuild an unversioned alerts table (rowid, ISO text timestamps) in the current layout"""
+        image_column = 'image_data' if 'image_data' in columns else 'NULL'
+        rows = conn.execute(f"""
+            SELECT alert_id, alert_type, camera_id, message, confidence, timestamp,
+                   location, frame_path, acknowledged, acknowledged_by, acknowledged_at,
+                   created_at, data, {image_column}
+            FROM alerts
+        """).fetchall()
+        
+        conn.execute("DROP TABLE alerts")
+        self._create_alerts_table(conn)
+        
+        migrated = []
+        for row in rows:
+            row = list(row)
+            if isinstance(row[5], str):
+                # Rows copied from a file that was already migrated hold microseconds
+                row[5] = _timestamp_us(datetime.fromisoformat(row[5]))
+            if row[13] is None and row[12]:
+                # Older rows kept the frame base64-encoded inside the JSON blob
+                image_data = json.loads(row[12]).get('image_data')
+                if image_data:
+                    row[13] = base64.b64decode(image_data)
+            migrated.append(row)
+        
+        conn.executemany("""
+            INSERT INTO alerts (
+                alert_id, alert_type, camera_id, message, confidence, timestamp,
+                location, frame_path, acknowledged, acknowledged_by, acknowledged_at,
+                created_at, data, image_data
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, migrated)
+        
+        self.logger.info(f"Migrated {len(migrated)} alerts to schema version {SCHEMA_VERSION}")
     
     def save_alert(self, alert: AlertMessage, frame_path: Optional[str] = None) -> bool:
         """Save alert to database"""
+        return all(self.save_alerts_batch([alert], [frame_path]))
+    
+    def save_alerts_batch(self, alerts: List[AlertMessage],
+                          frame_paths: Optional[List[Optional[str]]] = None) -> List[bool]:
+        """Save several alerts and their statistics in one transaction
+        
+        Returns one flag per alert. A row that is rejected (duplicate alert_id or
+        a constraint failure) is skipped without rolling back the rest.
+        """
+        if not alerts:
+            return []
+        if frame_paths is None:
+            frame_paths = [None] * len(alerts)
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT INTO alerts (
-                        alert_id, alert_type, camera_id, message, confidence,
-                        timestamp, location, frame_path, acknowledged,
-                        acknowledged_by, acknowledged_at, data
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+            rows = []
+            stats_rows = []
+            for alert, frame_path in zip(alerts, frame_paths):
+                rows.append((
                     alert.alert_id,
                     alert.alert_type,
                     alert.camera_id,
                     alert.message,
                     alert.confidence,
-                    alert.timestamp.isoformat(),
+                    _timestamp_us(alert.timestamp),
                     alert.location,
                     frame_path,
                     alert.acknowledged,
                     alert.acknowledged_by,
-                    alert.acknowledged_at.isoformat() if alert.acknowledged_at else None,
-                    json.dumps(alert.to_dict())
+                    _timestamp_us(alert.acknowledged_at) if alert.acknowledged_at else None,
+                    alert.image_data
                 ))
                 
-                # Update statistics
                 hour_key = alert.timestamp.strftime('%Y-%m-%d-%H')
                 day_key = alert.timestamp.strftime('%Y-%m-%d')
-                
-                conn.execute("""
-                    INSERT OR REPLACE INTO alert_stats (hour_key, day_key, alert_type, count)
-                    VALUES (?, ?, ?, 
-                        COALESCE((SELECT count + 1 FROM alert_stats 
-                                  WHERE hour_key = ? AND day_key = ? AND alert_type = ?), 1)
-                    )
-                """, (hour_key, day_key, alert.alert_type, hour_key, day_key, alert.alert_type))
-                
-                conn.commit()
-                return True
-                
+                stats_rows.append((hour_key, day_key, alert.alert_type))
+            
+            saved = []
+            with self._get_conn() as conn:
+                for row, stats_row in zip(rows, stats_rows):
+                    try:
+                        inserted = conn.execute(INSERT_ALERT_SQL, row).rowcount > 0
+                        if not inserted:
+                            self.logger.warning(f"Skipped duplicate alert {row[0]}")
+                    except sqlite3.IntegrityError as e:
+                        # A failed statement is undone on its own; the transaction carries on
+                        self.logger.error(f"Failed to save alert {row[0]}: {e}")
+                        inserted = False
+                    if inserted:
+                        # Update statistics in place rather than probing and replacing the row
+                        conn.execute(UPSERT_STAT_SQL, stats_row)
+                    saved.append(inserted)
+            
+            if any(saved):
+                self._invalidate_cache()
+            return saved
+            
         except Exception as e:
-            self.logger.error(f"Failed to save alert: {e}")
-            return False
+            self.logger.error(f"Failed to save {len(alerts)} alert(s): {e}")
+            return [False] * len(alerts)
+    
+    @staticmethod
+    def _parse_acknowledged_at(value) -> Optional[datetime]:
+        """Read acknowledged_at, which older rows hold as ISO text rather than microseconds"""
+        if value is None:
+            return None
+        if isinstance(value, int):
+            return _from_timestamp_us(value)
+        return datetime.fromisoformat(value)
+    
+    @classmethod
+    def _row_to_alert(cls, row, image_data: Optional[bytes] = None) -> AlertMessage:
+        """Build an AlertMessage from the typed alert columns"""
+        (alert_id, alert_type, camera_id, message, confidence, timestamp,
+         location, acknowledged, acknowledged_by, acknowledged_at) = row
+        return AlertMessage(
+            alert_id=alert_id,
+            alert_type=alert_type,
+            camera_id=camera_id,
+            message=message,
+            confidence=confidence,
+            timestamp=_from_timestamp_us(timestamp),
+            image_data=image_data,
+            location=location or "",
+            acknowledged=bool(acknowledged),
+            acknowledged_by=acknowledged_by,
+            acknowledged_at=cls._parse_acknowledged_at(acknowledged_at)
+        )
     
     def get_recent_alerts(self, hours: int = 24, limit: int = 100) -> List[AlertMessage]:
-        """Get recent alerts from database"""
+        """Get recent alerts from database (without image data)"""
+        key = ('recent', hours, limit)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return list(cached)
+        
         try:
-            cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
+            generation = self._generation
+            cutoff_time = datetime.now() - timedelta(hours=hours)
             
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute("""
-                    SELECT data FROM alerts 
-                    WHERE timestamp > ? 
-                    ORDER BY timestamp DESC 
-                    LIMIT ?
-                """, (cutoff_time, limit))
+            with self._get_conn() as conn:
+                cursor = conn.execute(SELECT_RECENT_SQL, (_timestamp_us(cutoff_time), limit))
                 
                 alerts = []
                 for row in cursor.fetchall():
                     try:
-                        data = json.loads(row['data'])
-                        alerts.append(AlertMessage.from_dict(data))
+                        alerts.append(self._row_to_alert(row))
                     except Exception as e:
                         self.logger.warning(f"Failed to parse alert data: {e}")
                 
-                return alerts
+                self._cache_put(key, alerts, generation)
+                return list(alerts)
                 
         except Exception as e:
             self.logger.error(f"Failed to get recent alerts: {e}")
             return []
     
-    def acknowledge_alert(self, alert_id: str, acknowledged_by: str = "operator", notes: str = "") -> bool:
-        """Mark alert as acknowledged"""
+    def get_alert(self, alert_id: str, include_image: bool = True) -> Optional[AlertMessage]:
+        """Get a single alert, loading its image data only when requested"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    UPDATE alerts 
-                    SET acknowledged = TRUE,
-                        acknowledged_by = ?,
-                        acknowledged_at = CURRENT_TIMESTAMP
-                    WHERE alert_id = ?
-                """, (acknowledged_by, alert_id))
-                
-                affected = conn.execute("SELECT changes()").fetchone()[0]
-                conn.commit()
+            sql = SELECT_ALERT_WITH_IMAGE_SQL if include_image else SELECT_ALERT_SQL
+            with self._get_conn() as conn:
+                row = conn.execute(sql, (alert_id,)).fetchone()
                 
-                return affected > 0
+                if row is None:
+                    return None
+                return self._row_to_alert(tuple(row)[:-1], row[-1])
                 
+        except Exception as e:
+            self.logger.error(f"Failed to get alert {alert_id}: {e}")
+            return None
+    
+    def acknowledge_alert(self, alert_id: str, acknowledged_by: str = "operator", notes: str = "") -> bool:
+        """Mark alert as acknowledged"""
+        try:
+            with self._get_conn() as conn:
+                cursor = conn.execute(ACK_ALERT_SQL, (acknowledged_by, _timestamp_us(datetime.now()), alert_id))
+            
+            if cursor.rowcount > 0:
+                self._invalidate_cache()
+                return True
+            return False
+            
         except Exception as e:
             self.logger.error(f"Failed to acknowledge alert: {e}")
             return False
     
     def get_unacknowledged_count(self) -> Dict[str, int]:
         """Get count of unacknowledged alerts by type"""
+        cached = self._cache_get('unacknowledged')
+        if cached is not None:
+            return dict(cached)
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT alert_type, COUNT(*) as count
-                    FROM alerts
-                    WHERE acknowledged = FALSE
-                    GROUP BY alert_type
-                """)
+            generation = self._generation
+            with self._get_conn() as conn:
+                cursor = conn.execute(UNACK_COUNT_SQL)
                 
                 counts = {'P1': 0, 'P2': 0, 'P4': 0}
                 for row in cursor.fetchall():
                     counts[row[0]] = row[1]
                 
-                return counts
+                self._cache_put('unacknowledged', counts, generation)
+                return dict(counts)
                 
         except Exception as e:
             self.logger.error(f"Failed to get unacknowledged count: {e}")
             return {'P1': 0, 'P2': 0, 'P4': 0}
     
+    def _unlink_frame(self, frame_path: Optional[str]) -> bool:
+        """Delete an alert frame file, returning False if it could not be removed"""
+        if not frame_path:
+            return True
+        try:
+            Path(frame_path).unlink(missing_ok=True)
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to delete frame file {frame_path}: {e}")
+            return False
+    
     def cleanup_old_alerts(self, retention_days: int):
         """Remove alerts older than retention period"""
         try:
-            cutoff_date = (datetime.now() - timedelta(days=retention_days)).isoformat()
+            cutoff_date = datetime.now() - timedelta(days=retention_days)
             
-            with sqlite3.connect(self.db_path) as conn:
-                # Get frame paths to delete
-                cursor = conn.execute("""
-                    SELECT frame_path FROM alerts 
-                    WHERE timestamp < ? AND frame_path IS NOT NULL
-                """, (cutoff_date,))
-                
-                frame_paths = [row[0] for row in cursor.fetchall()]
+            conn = self._get_conn()
+            rows = conn.execute("""
+                SELECT alert_id, frame_path FROM alerts 
+                WHERE timestamp < ?
+            """, (_timestamp_us(cutoff_date),)).fetchall()
+            
+            # Delete frame files first, in parallel, so rows whose frame could not be
+            # removed stay behind and are retried on the next cleanup
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                removed = list(executor.map(self._unlink_frame, [row[1] for row in rows]))
+            deleted_ids = [(row[0],) for row, ok in zip(rows, removed) if ok]
+            
+            with conn:
+                conn.execute("CREATE TEMP TABLE IF NOT EXISTS cleanup_ids (alert_id TEXT PRIMARY KEY)")
+                conn.execute("DELETE FROM cleanup_ids")
+                conn.executemany("INSERT INTO cleanup_ids VALUES (?)", deleted_ids)
                 
                 # Delete old alerts
-                conn.execute("DELETE FROM alerts WHERE timestamp < ?", (cutoff_date,))
+                conn.execute("DELETE FROM alerts WHERE alert_id IN (SELECT alert_id FROM cleanup_ids)")
+                conn.execute("DELETE FROM cleanup_ids")
                 
                 # Cleanup old stats
                 old_day_key = (datetime.now() - timedelta(days=retention_days + 1)).strftime('%Y-%m-%d')
                 conn.execute("DELETE FROM alert_stats WHERE day_key < ?", (old_day_key,))
-                
-                conn.commit()
-                
-                # Delete associated frame files
-                for frame_path in frame_paths:
-                    try:
-                        Path(frame_path).unlink(missing_ok=True)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to delete frame file {frame_path}: {e}")
-                
-                self.logger.info(f"Cleaned up {len(frame_paths)} old alerts")
+            
+            self._invalidate_cache()
+            self.logger.info(f"Cleaned up {len(deleted_ids)} old alerts")
                 
         except Exception as e:
             self.logger.error(f"Failed to cleanup old alerts: {e}")
@@ -285,13 +643,21 @@ class AppNotificationManager:
         self.logger = logging.getLogger(__name__)
         
         # Initialize components
-        self.database = AlertDatabase(self.config.database_path)
-        self.alert_queue = Queue()
-        self.alert_callbacks: List[Callable[[AlertMessage], None]] = []
+        self.database = AlertDatabase(self.config.database_path, self.config.legacy_database_path)
+        self.alert_queue = deque()
+        self.alert_event = threading.Event()
+        self.max_batch_size = 256
+        # OpenCV releases the GIL while encoding, so frames in a batch encode in parallel
+        self.frame_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="alert-frame")
+        # Replaced rather than mutated, so the processor can iterate it without locking
+        self.alert_callbacks: Tuple[Callable[[AlertMessage], None], ...] = ()
         
         # Rate limiting
-        self.alert_counts = {'hourly': {}, 'daily': {}}
-        self.last_cleanup = datetime.now()
+        # Counts keyed by epoch hour/day; the key deques bound how many buckets are kept
+        self._hourly_counts = Counter()
+        self._hourly_keys = deque(maxlen=25)
+        self._daily_counts = Counter()
+        self._daily_keys = deque(maxlen=8)
         
         # Processing state
         self.is_processing = False
@@ -305,7 +671,7 @@ class AppNotificationManager:
     
     def register_callback(self, callback: Callable[[AlertMessage], None]):
         """Register callback for new alerts (for UI updates)"""
-        self.alert_callbacks.append(callback)
+        self.alert_callbacks = (*self.alert_callbacks, callback)
     
     def send_fire_alert(self, alert: AlertMessage, image_frame: Optional[np.ndarray] = None):
         """Send fire detection alert to application"""
@@ -315,19 +681,11 @@ class AppNotificationManager:
                 self.logger.warning(f"Rate limit exceeded for {alert.alert_type} alerts")
                 return
             
-            # Save frame if provided
-            frame_path = None
-            if image_frame is not None:
-                frame_path = self._save_alert_frame(alert.alert_id, image_frame)
+            # Queue for processing - the processor thread encodes frames and writes alerts in batches
+            self.alert_queue.append((alert, image_frame))
+            self.alert_event.set()
+            self.logger.info(f"Alert {alert.alert_id} queued for processing")
             
-            # Save to database
-            if self.database.save_alert(alert, frame_path):
-                # Queue for processing
-                self.alert_queue.put(alert)
-                self.logger.info(f"Alert {alert.alert_id} queued for processing")
-            else:
-                self.logger.error(f"Failed to save alert {alert.alert_id}")
-                
         except Exception as e:
             self.logger.error(f"Failed to send fire alert: {e}")
     
@@ -338,8 +696,16 @@ class AppNotificationManager:
             filename = f"{alert_id}_{timestamp}.jpg"
             filepath = Path(self.config.alert_frames_dir) / filename
             
-            # Encode and save frame
-            cv2.imwrite(str(filepath), frame)
+            # Encode and save frame (frames are BGR uint8, which both encoders take as-is)
+            if _turbo_jpeg is not None:
+                filepath.write_bytes(_turbo_jpeg.encode(frame, quality=85))
+            else:
+                ok, buffer = cv2.imencode('.jpg', frame, [int(cv2.IMWRITE_JPEG_QUALITY), 85,
+                                                          int(cv2.IMWRITE_JPEG_OPTIMIZE), 0])
+                if not ok:
+                    self.logger.error(f"Failed to encode alert frame for {alert_id}")
+                    return None
+                filepath.write_bytes(buffer.tobytes())
             
             return str(filepath)
             
@@ -349,49 +715,33 @@ class AppNotificationManager:
     
     def _check_rate_limits(self, alert_type: str) -> bool:
         """Check if alert is within rate limits"""
-        now = datetime.now()
-        
-        # Cleanup old counts
-        if now - self.last_cleanup > timedelta(hours=1):
-            self._cleanup_rate_limits()
+        hour = int(time.time()) // 3600
+        day = hour // 24
+        self._track_bucket(hour, self._hourly_counts, self._hourly_keys)
+        self._track_bucket(day, self._daily_counts, self._daily_keys)
         
         # Check hourly limit
-        hour_key = now.strftime('%Y-%m-%d-%H')
-        hourly_count = self.alert_counts['hourly'].get(hour_key, 0)
-        
-        if hourly_count >= self.config.max_alerts_per_hour:
+        if self._hourly_counts[hour] >= self.config.max_alerts_per_hour:
             return False
         
         # Check daily limit
-        day_key = now.strftime('%Y-%m-%d')
-        daily_count = self.alert_counts['daily'].get(day_key, 0)
-        
-        if daily_count >= self.config.max_alerts_per_day:
+        if self._daily_counts[day] >= self.config.max_alerts_per_day:
             return False
         
         # Update counts
-        self.alert_counts['hourly'][hour_key] = hourly_count + 1
-        self.alert_counts['daily'][day_key] = daily_count + 1
+        self._hourly_counts[hour] += 1
+        self._daily_counts[day] += 1
         
         return True
     
-    def _cleanup_rate_limits(self):
-        """Cleanup old rate limit counts"""
-        now = datetime.now()
-        
-        # Remove old hourly counts
-        cutoff_hour = (now - timedelta(hours=24)).strftime('%Y-%m-%d-%H')
-        self.alert_counts['hourly'] = {
-            k: v for k, v in self.alert_counts['hourly'].items() if k >= cutoff_hour
-        }
-        
-        # Remove old daily counts
-        cutoff_day = (now - timedelta(days=7)).strftime('%Y-%m-%d')
-        self.alert_counts['daily'] = {
-            k: v for k, v in self.alert_counts['daily'].items() if k >= cutoff_day
-        }
-        
-        self.last_cleanup = now
+    @staticmethod
+    def _track_bucket(key: int, counts: Counter, keys: deque):
+        """Register a new time bucket, evicting the oldest once the window is full"""
+        if keys and keys[-1] == key:
+            return
+        if len(keys) == keys.maxlen:
+            del counts[keys[0]]
+        keys.append(key)
     
     def start_processing(self):
         """Start alert processing thread"""
@@ -401,45 +751,99 @@ class AppNotificationManager:
         self.logger.info("Started alert processing")
     
     def stop_processing(self):
-        """Stop alert processing"""
+        """Stop alert processing, persisting any alerts still queued"""
         self.is_processing = False
+        self.alert_event.set()
         if self.processor_thread:
             self.processor_thread.join(timeout=5)
+        
+        # Whatever the processor didn't get to (it was still busy when the join
+        # timed out, or alerts arrived as it exited) is written here instead
+        self._drain_queue()
+        if self.processor_thread and self.processor_thread.is_alive():
+            self.logger.warning("Alert processor did not stop in time; its current batch may still be saving")
+        self.frame_executor.shutdown(wait=True)
+        self.database.close()
         self.logger.info("Stopped alert processing")
     
     def _process_alerts(self):
         """Process alert queue"""
         while self.is_processing:
-            try:
-                # Get alert from queue
-                alert = self.alert_queue.get(timeout=1)
-                
-                # Notify all registered callbacks
-                for callback in self.alert_callbacks:
+            # Time out periodically so stop_processing is noticed
+            if not self.alert_event.wait(timeout=1):
+                continue
+            self.alert_event.clear()
+            
+            self._drain_queue()
+            
+            # Cleanup old alerts periodically
+            if hasattr(self, '_last_cleanup_check'):
+                if datetime.now() - self._last_cleanup_check > timedelta(hours=24):
+                    self.database.cleanup_old_alerts(self.config.alert_retention_days)
+                    self._last_cleanup_check = datetime.now()
+            else:
+                self._last_cleanup_check = datetime.now()
+        
+        # Alerts queued while stopping are persisted before the thread exits
+        self._drain_queue()
+        
+        # Release the connection this thread used for cleanup
+        self.database.close()
+    
+    def _drain_queue(self):
+        """Write every queued alert, up to max_batch_size alerts per transaction"""
+        while self.alert_queue:
+            batch = []
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self.alert_queue.popleft())
+                except IndexError:
+                    break
+            if batch:
+                self._process_batch(batch)
+    
+    def _process_batch(self, batch: List[Tuple[AlertMessage, Optional[np.ndarray]]]):
+        """Save a batch of queued alerts and their frames, then notify callbacks"""
+        log_error = self.logger.error
+        try:
+            # Encode and write the batch's frames before their rows are committed
+            alerts = [alert for alert, _ in batch]
+            frame_futures = [
+                self.frame_executor.submit(self._save_alert_frame, alert.alert_id, frame)
+                if frame is not None else None
+                for alert, frame in batch
+            ]
+            frame_paths = [future.result() if future else None for future in frame_futures]
+            
+            saved = self.database.save_alerts_batch(alerts, frame_paths)
+            
+            # Notify all registered callbacks (one snapshot per batch) for the
+            # alerts that were stored, and drop the frames of those that weren't
+            callbacks = self.alert_callbacks
+            for alert, frame_path, ok in zip(alerts, frame_paths, saved):
+                if not ok:
+                    self.database._unlink_frame(frame_path)
+                    continue
+                for callback in callbacks:
                     try:
                         callback(alert)
                     except Exception as e:
-                        self.logger.error(f"Alert callback error: {e}")
-                
-                # Cleanup old alerts periodically
-                if hasattr(self, '_last_cleanup_check'):
-                    if datetime.now() - self._last_cleanup_check > timedelta(hours=24):
-                        self.database.cleanup_old_alerts(self.config.alert_retention_days)
-                        self._last_cleanup_check = datetime.now()
-                else:
-                    self._last_cleanup_check = datetime.now()
-                
-                self.alert_queue.task_done()
-                
-            except Empty:
-                continue
-            except Exception as e:
-                self.logger.error(f"Alert processing error: {e}")
+                        log_error(f"Alert callback error: {e}")
+            
+            failed = saved.count(False)
+            if failed:
+                log_error(f"Failed to save {failed} of {len(alerts)} queued alert(s)")
+        except Exception as e:
+            log_error(f"Alert processing error: {e}")
     
     def get_recent_alerts(self, hours: int = 24) -> List[AlertMessage]:
         """Get recent alerts"""
         return self.database.get_recent_alerts(hours)
     
+    def get_alert(self, alert_id: str, include_image: bool = True) -> Optional[AlertMessage]:
+        """Get a single alert with its image data"""
+        return self.database.get_alert(alert_id, include_image)
+    
     def get_unacknowledged_count(self) -> Dict[str, int]:
         """Get unacknowledged alert counts"""
         return self.database.get_unacknowledged_count()
@@ -451,41 +855,29 @@ class AppNotificationManager:
     def get_alert_stats(self) -> Dict:
         """Get alert statistics"""
         try:
-            with sqlite3.connect(self.database.db_path) as conn:
-                # Get today's stats
-                today = datetime.now().strftime('%Y-%m-%d')
-                cursor = conn.execute("""
-                    SELECT alert_type, SUM(count) as total
-                    FROM alert_stats
-                    WHERE day_key = ?
-                    GROUP BY alert_type
-                """, (today,))
-                
-                today_stats = {'P1': 0, 'P2': 0, 'P4': 0}
-                for row in cursor.fetchall():
-                    today_stats[row[0]] = row[1]
-                
-                # Get last 7 days stats
-                week_ago = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-                cursor = conn.execute("""
-                    SELECT alert_type, SUM(count) as total
-                    FROM alert_stats
-                    WHERE day_key >= ?
-                    GROUP BY alert_type
-                """, (week_ago,))
-                
-                week_stats = {'P1': 0, 'P2': 0, 'P4': 0}
-                for row in cursor.fetchall():
-                    week_stats[row[0]] = row[1]
+            today = datetime.now().strftime('%Y-%m-%d')
+            week_ago = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+            
+            with self.database._get_conn() as conn:
+                cursor = conn.execute(ALERT_STATS_SQL, (today, week_ago))
                 
-                # Get unacknowledged counts
-                unacknowledged = self.get_unacknowledged_count()
+                stats = {
+                    'today': {'P1': 0, 'P2': 0, 'P4': 0},
+                    'week': {'P1': 0, 'P2': 0, 'P4': 0},
+                    'unack': {'P1': 0, 'P2': 0, 'P4': 0}
+                }
+                total_stored = 0
+                for key, alert_type, count in cursor.fetchall():
+                    if key == 'total':
+                        total_stored = count
+                    else:
+                        stats[key][alert_type] = count
                 
                 return {
-                    'today': today_stats,
-                    'last_7_days': week_stats,
-                    'unacknowledged': unacknowledged,
-                    'total_stored': conn.execute("SELECT COUNT(*) FROM alerts").fetchone()[0]
+                    'today': stats['today'],
+                    'last_7_days': stats['week'],
+                    'unacknowledged': stats['unack'],
+                    'total_stored': total_stored
                 }
                 
         except Exception as e:
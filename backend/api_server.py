@@ -5,17 +5,25 @@ HTTP API server for Tauri frontend communication
 """
 
 import asyncio
-import json
+import base64
+import functools
+import gzip
 import logging
+import logging.handlers
+import os
+import queue
 import signal
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 from aiohttp import web, web_request
 from aiohttp.web_response import Response
-import aiohttp_cors
+import cv2
+import orjson
 
 # Add backend to path
 sys.path.append(str(Path(__file__).parent))
@@ -24,37 +32,186 @@ from main import SentinelSystem, APIServer
 from alerts.alert_manager import get_alert_manager
 from utils.system_monitor import system_monitor
 from config.camera_config import CameraConfigManager, CameraProfile
+from detection.rtsp_manager import RTSPManager
+
+# JPEG encoding runs here so it doesn't stall the event loop; OpenCV releases
+# the GIL while encoding, so concurrent frame requests encode in parallel
+_JPEG_EXECUTOR = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                    thread_name_prefix="jpeg-encode")
+
+# Optional nvJPEG encoding on NVIDIA GPUs (torchvision 0.19+ encodes CUDA tensors);
+# cleared on the first failure so older torchvision builds fall back to OpenCV
+try:
+    import torch
+    from torchvision.io import encode_jpeg as _gpu_encode_jpeg
+    _gpu_jpeg_enabled = torch.cuda.is_available()
+except Exception:
+    _gpu_jpeg_enabled = False
+
+def encode_jpeg(frame, quality: int = 80) -> Optional[bytes]:
+    """Encode a BGR frame as JPEG bytes, on the GPU when one is available"""
+    global _gpu_jpeg_enabled
+    if _gpu_jpeg_enabled:
+        try:
+            # Upload HWC BGR, reorder to CHW RGB on the device; only the compressed bytes come back
+            tensor = torch.from_numpy(frame).cuda().permute(2, 0, 1).flip(0).contiguous()
+            return _gpu_encode_jpeg(tensor, quality=quality).cpu().numpy().tobytes()
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"GPU JPEG encoding unavailable, using OpenCV: {e}")
+            _gpu_jpeg_enabled = False
+    
+    ok, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return buffer.tobytes() if ok else None
+
+# Metrics and detections can carry numpy scalars
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def orjson_response(data: Any, status: int = 200) -> Response:
+    """JSON response serialized with orjson instead of the stdlib json module"""
+    return web.Response(body=orjson.dumps(data, option=ORJSON_OPTIONS), status=status,
+                        content_type='application/json')
+
+def error_response(body: bytes, status: int) -> Response:
+    """JSON error response from a pre-serialized body"""
+    return web.Response(body=body, status=status, content_type='application/json')
+
+# Bodies of the fixed error messages, serialized once
+ERR_BACKEND_NOT_INIT = orjson.dumps({'error': 'Backend not initialized'})
+ERR_CAMERAS_NOT_INIT = orjson.dumps({'error': 'Camera system not initialized'})
+ERR_NO_ALERT_FRAME = orjson.dumps({'error': 'No frame available for this alert'})
+ERR_CAMERA_CONFIG_SAVE = orjson.dumps({'error': 'Failed to save camera configuration'})
+ERR_MISSING_RTSP_URL = orjson.dumps({'error': 'Missing rtsp_url'})
+
+def backend_ready(server) -> bool:
+    """Whether the Sentinel backend and its API handler are up"""
+    return server.api_handler is not None
+
+def cameras_ready(server) -> bool:
+    """Whether the stream processor that owns the cameras is up"""
+    return server.sentinel_system is not None and server.sentinel_system.stream_processor is not None
+
+def require_ready(is_ready: Callable[[Any], bool], error_body: bytes, action: str):
+    """Answer 500 with error_body until is_ready(server), and turn handler errors into JSON 500s"""
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(self, request: web_request.BaseRequest):
+            if not is_ready(self):
+                return error_response(error_body, status=500)
+            try:
+                return await handler(self, request)
+            except Exception as e:
+                self.logger.error(f"Error {action}: {e}")
+                return orjson_response({'error': str(e)}, status=500)
+        return wrapper
+    return decorator
+
+# Liveness-only heartbeat body (GET /api/health?minimal=1), built once
+HEALTH_MINIMAL_BODY = b'{"status":"healthy"}'
+
+# Responses smaller than this aren't worth the gzip overhead
+COMPRESS_MIN_BYTES = 1024
+
+@web.middleware
+async def compression_middleware(request: web_request.BaseRequest, handler) -> Response:
+    """Gzip larger JSON/text responses for clients that accept it"""
+    response = await handler(request)
+    
+    if (isinstance(response, web.Response)
+            and request.match_info.route.name != 'camera_frame'
+            and response.body is not None
+            and len(response.body) > COMPRESS_MIN_BYTES
+            and response.content_type.startswith(('application/json', 'text/'))
+            and 'Content-Encoding' not in response.headers
+            and 'gzip' in request.headers.get('Accept-Encoding', '')):
+        response.enable_compression(web.ContentCoding.gzip)
+    
+    return response
+
+# Static part of the CORS headers for the local Tauri frontend
+CORS_HEADERS = {
+    'Access-Control-Allow-Credentials': 'true',
+    'Access-Control-Expose-Headers': 'X-Camera-Id, X-Timestamp, ETag, X-Alert-Id, X-Alert-Timestamp, X-Confidence',
+}
+
+def cors_headers(request: web_request.BaseRequest) -> Dict[str, str]:
+    """CORS headers for a request; credentialed requests need the origin echoed back rather than '*'"""
+    return {**CORS_HEADERS, 'Access-Control-Allow-Origin': request.headers.get('Origin', '*')}
+
+@web.middleware
+async def cors_middleware(request: web_request.BaseRequest, handler) -> Response:
+    """Answer CORS preflights and tag every response with CORS headers"""
+    if request.method == 'OPTIONS' and 'Access-Control-Request-Method' in request.headers:
+        return web.Response(status=204, headers={
+            **cors_headers(request),
+            'Access-Control-Allow-Methods': request.headers['Access-Control-Request-Method'],
+            'Access-Control-Allow-Headers': request.headers.get('Access-Control-Request-Headers', ''),
+        })
+    
+    response = await handler(request)
+    
+    # Streaming handlers send their headers (CORS included) before returning
+    if not response.prepared:
+        response.headers.update(cors_headers(request))
+    return response
+
+# Fixed part of the /api/status body; answering at all means the API server is up
+_STATUS_TEMPLATE = {'api_server_running': True}
+
+# Read size for streaming alert frames as base64; a multiple of 3 so chunks encode without padding
+BASE64_CHUNK_BYTES = 48 * 1024
+
+# MJPEG stream framing (GET /api/cameras/{camera_id}/stream)
+MJPEG_CONTENT_TYPE = 'multipart/x-mixed-replace; boundary=frame'
+MJPEG_PART_HEADER = b'--frame\r\nContent-Type: image/jpeg\r\n\r\n'
 
 class SentinelAPIServer:
     """HTTP API Server for Tauri communication"""
     
     def __init__(self, port: int = 8765):
         self.port = port
-        self.app = web.Application()
+        self.app = web.Application(middlewares=[cors_middleware, compression_middleware])
         self.sentinel_system: Optional[SentinelSystem] = None
         self.api_handler: Optional[APIServer] = None
         self.camera_config = CameraConfigManager()
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
         self.logger = self._setup_logging()
         self.is_running = False
+        self._shutdown = asyncio.Event()
+        self._runner: Optional[web.AppRunner] = None
+        self._backend_task: Optional[asyncio.Task] = None
+        self._rtsp_manager = None
         
-        # Setup CORS for Tauri communication
-        self.cors = aiohttp_cors.setup(self.app, defaults={
-            "*": aiohttp_cors.ResourceOptions(
-                allow_credentials=True,
-                expose_headers="*",
-                allow_headers="*",
-                allow_methods="*"
-            )
-        })
+        # Serialized bodies of frequently polled GET endpoints: key -> [expires_at, body, gzipped body]
+        self._response_cache: Dict[str, list] = {}
+        self._cache_locks: Dict[str, asyncio.Lock] = {}
+        
+        # Per-camera fields of /api/cameras entries that don't change while a camera exists
+        self._camera_static: Dict[str, Dict[str, Any]] = {}
+        
+        # Latest encoded JPEG per camera: camera_id -> (frame_count, timestamp, bytes)
+        self._jpeg_cache: Dict[str, tuple] = {}
+        # Encodes in flight: camera_id -> (frame_count, future), so concurrent requests share one
+        self._jpeg_pending: Dict[str, tuple] = {}
         
         self._setup_routes()
         
     def _setup_logging(self) -> logging.Logger:
         """Configure API server logging"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        # Handlers only enqueue records; a background listener does the stderr writes,
+        # so logging from request handlers never blocks the event loop on I/O
+        if not logging.getLogger().handlers:
+            log_queue = queue.SimpleQueue()
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                handlers=[logging.handlers.QueueHandler(log_queue)]
+            )
+            # Records arrive already formatted by the QueueHandler
+            self._log_listener = logging.handlers.QueueListener(
+                log_queue, logging.StreamHandler(), respect_handler_level=True
+            )
+            self._log_listener.start()
+        
         return logging.getLogger(__name__)
     
     def _setup_routes(self):
@@ -74,7 +231,8 @@ class SentinelAPIServer:
         
         # Camera feeds
         self.app.router.add_get('/api/cameras', self.get_camera_feeds)
-        self.app.router.add_get('/api/cameras/{camera_id}/frame', self.get_camera_frame)
+        self.app.router.add_get('/api/cameras/{camera_id}/frame', self.get_camera_frame, name='camera_frame')
+        self.app.router.add_get('/api/cameras/{camera_id}/stream', self.stream_camera)
         self.app.router.add_post('/api/cameras/discover', self.discover_cameras)
         self.app.router.add_post('/api/cameras/add', self.add_camera)
         self.app.router.add_post('/api/cameras/{camera_id}/test', self.test_camera)
@@ -85,217 +243,402 @@ class SentinelAPIServer:
         
         # System metrics (real performance data)
         self.app.router.add_get('/api/metrics', self.get_system_metrics)
+    
+    async def _cached_json(self, request: web_request.BaseRequest, key: str, ttl: float,
+                           producer) -> Response:
+        """Serve a JSON body from the short-lived response cache, rebuilding it when expired"""
+        cached = self._response_cache.get(key)
+        if cached is None or cached[0] <= time.monotonic():
+            # Concurrent polls of an expired key wait for one rebuild instead of each running it
+            lock = self._cache_locks.get(key)
+            if lock is None:
+                lock = self._cache_locks[key] = asyncio.Lock()
+            
+            async with lock:
+                cached = self._response_cache.get(key)
+                if cached is None or cached[0] <= time.monotonic():
+                    data = producer()
+                    if asyncio.iscoroutine(data):
+                        data = await data
+                    # [expires, body, gzipped body once a client has asked for it]
+                    cached = [time.monotonic() + ttl, orjson.dumps(data, option=ORJSON_OPTIONS), None]
+                    self._response_cache[key] = cached
+        
+        body = cached[1]
+        if len(body) > COMPRESS_MIN_BYTES and 'gzip' in request.headers.get('Accept-Encoding', ''):
+            # Compress once per cache entry rather than on every poll
+            if cached[2] is None:
+                cached[2] = gzip.compress(body, compresslevel=6, mtime=0)
+            return web.Response(body=cached[2], content_type='application/json', headers={
+                'Content-Encoding': 'gzip',
+                'Vary': 'Accept-Encoding'
+            })
         
-        # Enable CORS for all routes
-        for route in list(self.app.router.routes()):
-            self.cors.add(route)
+        return web.Response(body=body, content_type='application/json')
+    
+    def _get_rtsp_manager(self):
+        """Shared RTSPManager for camera discovery and connection tests"""
+        if self._rtsp_manager is None:
+            self._rtsp_manager = RTSPManager()
+        return self._rtsp_manager
+    
+    def _invalidate_cache(self, *keys: str):
+        """Drop cached responses made stale by a write"""
+        for key in keys:
+            self._response_cache.pop(key, None)
     
     async def health_check(self, request: web_request.BaseRequest) -> Response:
         """Health check endpoint"""
-        return web.json_response({
+        if request.query.get('minimal') == '1':
+            return web.Response(body=HEALTH_MINIMAL_BODY, content_type='application/json')
+        
+        return orjson_response({
             'status': 'healthy',
             'timestamp': time.time(),
             'backend_running': self.sentinel_system is not None and self.sentinel_system.is_running
         })
     
+    @require_ready(backend_ready, ERR_BACKEND_NOT_INIT, "getting dashboard data")
     async def get_dashboard_data(self, request: web_request.BaseRequest) -> Response:
         """Get dashboard data for frontend"""
-        try:
-            if not self.api_handler:
-                return web.json_response({'error': 'Backend not initialized'}, status=500)
-            
-            data = self.api_handler.get_dashboard_data()
-            return web.json_response(data)
-            
-        except Exception as e:
-            self.logger.error(f"Error getting dashboard data: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+        return await self._cached_json(request, 'dashboard', 0.5, self.api_handler.aget_dashboard_data)
     
+    @require_ready(backend_ready, ERR_BACKEND_NOT_INIT, "updating threshold")
     async def update_threshold(self, request: web_request.BaseRequest) -> Response:
-        """Update detection threshold"""
-        try:
-            if not self.api_handler:
-                return web.json_response({'error': 'Backend not initialized'}, status=500)
-            
-            data = await request.json()
-            threshold_name = data.get('threshold_name')
-            value = data.get('value')
-            
-            if not threshold_name or value is None:
-                return web.json_response({'error': 'Missing threshold_name or value'}, status=400)
-            
-            success = self.api_handler.update_threshold(threshold_name, float(value))
-            return web.json_response({'success': success})
-            
-        except Exception as e:
-            self.logger.error(f"Error updating threshold: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+        """Update one detection threshold, or several when given a JSON array"""
+        data = await request.json(loads=orjson.loads)
+        
+        if isinstance(data, list):
+            results = [self._update_one_threshold(item) for item in data]
+            self._invalidate_cache('dashboard')
+            return orjson_response({
+                'success': all(r['success'] for r in results),
+                'results': results
+            })
+        
+        result = self._update_one_threshold(data)
+        if 'error' in result:
+            return orjson_response({'error': result['error']}, status=400)
+        
+        self._invalidate_cache('dashboard')
+        return orjson_response({'success': result['success']})
     
+    def _update_one_threshold(self, data: Any) -> Dict[str, Any]:
+        """Apply a single {threshold_name, value} update"""
+        threshold_name = data.get('threshold_name') if isinstance(data, dict) else None
+        value = data.get('value') if isinstance(data, dict) else None
+        
+        if not threshold_name or value is None:
+            return {'success': False, 'error': 'Missing threshold_name or value'}
+        
+        return {
+            'threshold_name': threshold_name,
+            'success': self.api_handler.update_threshold(threshold_name, float(value))
+        }
+    
+    @require_ready(backend_ready, ERR_BACKEND_NOT_INIT, "acknowledging alert")
     async def acknowledge_alert(self, request: web_request.BaseRequest) -> Response:
-        """Acknowledge an alert"""
-        try:
-            if not self.api_handler:
-                return web.json_response({'error': 'Backend not initialized'}, status=500)
-            
-            data = await request.json()
-            alert_id = data.get('alert_id')
-            
-            if not alert_id:
-                return web.json_response({'error': 'Missing alert_id'}, status=400)
-            
-            success = self.api_handler.acknowledge_alert(alert_id)
-            return web.json_response({'success': success})
-            
-        except Exception as e:
-            self.logger.error(f"Error acknowledging alert: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+        """Acknowledge one alert, or several when given a JSON array"""
+        data = await request.json(loads=orjson.loads)
+        
+        if isinstance(data, list):
+            results = [self._acknowledge_one_alert(item) for item in data]
+            self._invalidate_cache('dashboard')
+            return orjson_response({
+                'success': all(r['success'] for r in results),
+                'results': results
+            })
+        
+        result = self._acknowledge_one_alert(data)
+        if 'error' in result:
+            return orjson_response({'error': result['error']}, status=400)
+        
+        self._invalidate_cache('dashboard')
+        return orjson_response({'success': result['success']})
+    
+    def _acknowledge_one_alert(self, data: Any) -> Dict[str, Any]:
+        """Apply a single {alert_id} acknowledgement"""
+        alert_id = data.get('alert_id') if isinstance(data, dict) else None
+        
+        if not alert_id:
+            return {'success': False, 'error': 'Missing alert_id'}
+        
+        return {'alert_id': alert_id, 'success': self.api_handler.acknowledge_alert(alert_id)}
     
+    @require_ready(backend_ready, ERR_BACKEND_NOT_INIT, "getting alert frame")
     async def get_alert_frame(self, request: web_request.BaseRequest) -> Response:
-        """Get the saved frame for a specific alert"""
+        """Get the saved frame for a specific alert as raw JPEG bytes"""
+        alert_id = request.match_info['alert_id']
+        
+        # Recent alerts are served from memory, older ones by primary key
+        alert = await self.api_handler.sentinel.alert_manager.aget_alert(alert_id)
+        
+        if not alert:
+            return orjson_response({'error': f'Alert {alert_id} not found'}, status=404)
+        
+        if not alert.frame_path or not Path(alert.frame_path).exists():
+            return error_response(ERR_NO_ALERT_FRAME, status=404)
+        
+        # Legacy clients get the frame base64-encoded inside JSON
+        if request.query.get('format') == 'base64':
+            return await self._alert_frame_base64(request, alert)
+        
+        # Send the JPEG as-is; alert metadata travels in headers. FileResponse
+        # streams the file with sendfile() without reading it on the event loop
+        return web.FileResponse(alert.frame_path, headers={
+            'Content-Type': 'image/jpeg',
+            'X-Alert-Id': alert_id,
+            'X-Camera-Id': alert.camera_id,
+            'X-Alert-Timestamp': str(alert.timestamp),
+            'X-Confidence': str(alert.confidence)
+        })
+    
+    async def _alert_frame_base64(self, request: web_request.BaseRequest, alert) -> web.StreamResponse:
+        """Alert frame and metadata as JSON with a base64 image (GET ...?format=base64)"""
+        loop = asyncio.get_running_loop()
+        
+        # Open (and fail) before any of the response is sent
+        frame_file = await loop.run_in_executor(None, open, alert.frame_path, 'rb')
+        
         try:
-            alert_id = request.match_info['alert_id']
-            
-            if not self.api_handler:
-                return web.json_response({'error': 'Backend not initialized'}, status=500)
-            
-            # Get alert from database
-            alerts = self.api_handler.sentinel.alert_manager.database.get_recent_alerts(hours=24*7)
-            alert = None
-            
-            for a in alerts:
-                if a.id == alert_id:
-                    alert = a
-                    break
-            
-            if not alert:
-                return web.json_response({'error': f'Alert {alert_id} not found'}, status=404)
-            
-            if not alert.frame_path or not Path(alert.frame_path).exists():
-                return web.json_response({'error': 'No frame available for this alert'}, status=404)
-            
-            # Read the frame image
-            with open(alert.frame_path, 'rb') as f:
-                image_data = f.read()
-            
-            # Convert to base64 for JSON response
-            import base64
-            frame_base64 = base64.b64encode(image_data).decode('utf-8')
-            
-            return web.json_response({
-                'alert_id': alert_id,
-                'frame': frame_base64,
-                'timestamp': alert.timestamp,
-                'camera_id': alert.camera_id,
-                'confidence': alert.confidence,
-                'detections': alert.detections,
-                'format': 'jpeg'
+            response = web.StreamResponse(headers={
+                **cors_headers(request),
+                'Content-Type': 'application/json'
             })
-            
-        except Exception as e:
-            self.logger.error(f"Error getting alert frame: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            await response.prepare(request)
+            
+            # Headers are sent from here on, so errors end the stream instead of
+            # propagating to require_backend, which would try to send a second response
+            try:
+                # Metadata first, then the image encoded chunk by chunk, so neither the whole
+                # file nor its base64 text is ever held in memory
+                metadata = orjson.dumps({
+                    'alert_id': alert.id,
+                    'timestamp': alert.timestamp,
+                    'camera_id': alert.camera_id,
+                    'confidence': alert.confidence,
+                    'detections': alert.detections,
+                    'format': 'jpeg'
+                }, option=ORJSON_OPTIONS)
+                await response.write(metadata[:-1] + b',"frame":"')
+                
+                while chunk := await loop.run_in_executor(None, frame_file.read, BASE64_CHUNK_BYTES):
+                    await response.write(base64.b64encode(chunk))
+                
+                await response.write(b'"}')
+                await response.write_eof()
+            except ConnectionResetError:
+                # Client went away
+                pass
+            except Exception as e:
+                self.logger.error(f"Error streaming frame for alert {alert.id}: {e}")
+            
+            return response
+            
+        finally:
+            frame_file.close()
     
+    @require_ready(cameras_ready, ERR_CAMERAS_NOT_INIT, "getting camera feeds")
     async def get_camera_feeds(self, request: web_request.BaseRequest) -> Response:
         """Get camera feed status and data"""
-        try:
-            if not self.sentinel_system or not self.sentinel_system.stream_processor:
-                return web.json_response({'error': 'Camera system not initialized'}, status=500)
-            
-            # Get camera status from stream processor
-            camera_status = self.sentinel_system.stream_processor.get_camera_status()
-            
-            # Format for frontend
-            cameras = []
-            for camera_id, status in camera_status.items():
-                cameras.append({
+        return await self._cached_json(request, 'cameras', 0.5, self._build_camera_feeds)
+    
+    def _build_camera_feeds(self) -> Dict[str, Any]:
+        """Format stream processor camera status for the frontend"""
+        # Get camera status from stream processor
+        camera_status = self.sentinel_system.stream_processor.get_camera_status()
+        
+        # Format for frontend
+        cameras = []
+        active = 0
+        for camera_id, status in camera_status.items():
+            static = self._camera_static.get(camera_id)
+            if static is None:
+                static = self._camera_static[camera_id] = {
                     'id': camera_id,
                     'name': status.get('name', f'Camera {camera_id}'),
-                    'status': 'active' if status.get('running', False) else 'inactive',
                     'location': status.get('location', 'Unknown'),
-                    'last_frame_time': status.get('last_frame_time', 0),
-                    'fps': status.get('fps', 0),
                     'resolution': status.get('resolution', '1920x1080')
-                })
-            
-            return web.json_response({
-                'cameras': cameras,
-                'total_cameras': len(cameras),
-                'active_cameras': len([c for c in cameras if c['status'] == 'active'])
+                }
+            
+            running = bool(status.get('running', False))
+            active += running
+            cameras.append({
+                **static,
+                'status': 'active' if running else 'inactive',
+                'last_frame_time': status.get('last_frame_time', 0),
+                'fps': status.get('fps', 0)
             })
-            
-        except Exception as e:
-            self.logger.error(f"Error getting camera feeds: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+        
+        return {
+            'cameras': cameras,
+            'total_cameras': len(cameras),
+            'active_cameras': active
+        }
     
     async def get_system_status(self, request: web_request.BaseRequest) -> Response:
         """Get system status"""
         try:
-            backend_running = self.sentinel_system is not None and self.sentinel_system.is_running
-            
-            status = {
-                'backend_running': backend_running,
-                'api_server_running': True,
-                'timestamp': time.time(),
-                'uptime': time.time() - getattr(self.sentinel_system, 'start_time', time.time()) if backend_running else 0
-            }
-            
-            if backend_running and self.sentinel_system.stream_processor:
-                camera_status = self.sentinel_system.stream_processor.get_camera_status()
-                status.update({
-                    'active_cameras': len([c for c in camera_status.values() if c.get('running', False)]),
-                    'total_cameras': len(camera_status)
-                })
-            
-            return web.json_response(status)
+            return await self._cached_json(request, 'status', 0.25, self._build_system_status)
             
         except Exception as e:
             self.logger.error(f"Error getting system status: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return orjson_response({'error': str(e)}, status=500)
     
+    def _build_system_status(self) -> Dict[str, Any]:
+        """Collect backend and camera status"""
+        ss = self.sentinel_system
+        backend_running = ss is not None and ss.is_running
+        now = time.time()
+        
+        status = {
+            **_STATUS_TEMPLATE,
+            'backend_running': backend_running,
+            'timestamp': now,
+            'uptime': now - ss.start_time if backend_running else 0
+        }
+        
+        if backend_running and ss.stream_processor:
+            camera_status = ss.stream_processor.get_camera_status()
+            status['active_cameras'] = sum(1 for c in camera_status.values() if c.get('running', False))
+            status['total_cameras'] = len(camera_status)
+        
+        return status
+    
+    def _find_camera(self, camera_id: str):
+        """Look up a running simulator camera by ID"""
+        return self.sentinel_system.stream_processor.simulator.cameras_by_id.get(camera_id)
+    
+    async def _latest_jpeg(self, camera) -> Optional[tuple]:
+        """JPEG of the camera's current frame as (frame_count, timestamp, bytes), encoded once per frame"""
+        camera_id = camera.camera_id
+        
+        # Read the count first: if a new frame lands in between, the next call re-encodes
+        frame_count = camera.frame_count
+        cached = self._jpeg_cache.get(camera_id)
+        if cached is not None and cached[0] == frame_count:
+            return cached
+        
+        # Another request is already encoding this frame; share its result
+        pending = self._jpeg_pending.get(camera_id)
+        if pending is not None and pending[0] == frame_count:
+            return await asyncio.shield(pending[1])
+        
+        frame = camera.get_frame()
+        if frame is None:
+            return None
+        
+        future = asyncio.get_running_loop().run_in_executor(
+            _JPEG_EXECUTOR, self._encode_frame, frame_count, frame
+        )
+        self._jpeg_pending[camera_id] = (frame_count, future)
+        try:
+            cached = await asyncio.shield(future)
+        finally:
+            if self._jpeg_pending.get(camera_id, (None, None))[1] is future:
+                del self._jpeg_pending[camera_id]
+        
+        if cached is not None:
+            self._jpeg_cache[camera_id] = cached
+        return cached
+    
+    @staticmethod
+    def _encode_frame(frame_count: int, frame) -> Optional[tuple]:
+        """Encode a frame into a _jpeg_cache entry (runs on the JPEG executor)"""
+        jpeg = encode_jpeg(frame)
+        return (frame_count, time.time(), jpeg) if jpeg is not None else None
+    
+    @require_ready(cameras_ready, ERR_CAMERAS_NOT_INIT, "getting camera frame")
     async def get_camera_frame(self, request: web_request.BaseRequest) -> Response:
-        """Get current frame from specific camera as base64 JPEG"""
+        """Get current frame from specific camera as raw JPEG bytes"""
+        camera_id = request.match_info['camera_id']
+        
+        camera = self._find_camera(camera_id)
+        if camera is None or camera.get_frame() is None:
+            return orjson_response({'error': f'Camera {camera_id} not found'}, status=404)
+        
+        latest = await self._latest_jpeg(camera)
+        if latest is None:
+            return orjson_response({'error': f'Failed to encode frame for camera {camera_id}'}, status=500)
+        
+        frame_count, timestamp, jpeg = latest
+        
+        # Pollers that already have this frame get a bodiless 304
+        etag = f'"{camera_id}-{frame_count}"'
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers={'ETag': etag})
+        
+        # Send the JPEG as-is; frame metadata travels in headers
+        return web.Response(
+            body=jpeg,
+            content_type='image/jpeg',
+            headers={
+                'X-Camera-Id': camera_id,
+                'X-Timestamp': str(timestamp),
+                'ETag': etag,
+                'Last-Modified': formatdate(timestamp, usegmt=True)
+            }
+        )
+    
+    @require_ready(cameras_ready, ERR_CAMERAS_NOT_INIT, "streaming camera")
+    async def stream_camera(self, request: web_request.BaseRequest) -> web.StreamResponse:
+        """Push camera frames as an MJPEG (multipart/x-mixed-replace) stream"""
+        camera_id = request.match_info['camera_id']
+        
+        camera = self._find_camera(camera_id)
+        if camera is None:
+            return orjson_response({'error': f'Camera {camera_id} not found'}, status=404)
+        
+        # The camera thread wakes us on each new frame, so frames go out at its native FPS
+        loop = asyncio.get_running_loop()
+        frame_ready = asyncio.Event()
+        notify = lambda: loop.call_soon_threadsafe(frame_ready.set)
+        camera.add_frame_listener(notify)
+        
+        response = web.StreamResponse(headers={
+            **cors_headers(request),
+            'Content-Type': MJPEG_CONTENT_TYPE,
+            'Cache-Control': 'no-cache',
+        })
+        
         try:
-            camera_id = request.match_info['camera_id']
-            
-            if not self.sentinel_system or not self.sentinel_system.stream_processor:
-                return web.json_response({'error': 'Camera system not initialized'}, status=500)
-            
-            # Get frame from stream processor
-            frames = self.sentinel_system.stream_processor.simulator.get_camera_frames()
-            
-            if camera_id not in frames:
-                return web.json_response({'error': f'Camera {camera_id} not found'}, status=404)
-            
-            frame = frames[camera_id]
-            
-            # Encode frame as JPEG
-            import cv2
-            import base64
-            _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
-            frame_base64 = base64.b64encode(buffer).decode('utf-8')
-            
-            return web.json_response({
-                'camera_id': camera_id,
-                'frame': frame_base64,
-                'timestamp': time.time(),
-                'format': 'jpeg'
-            })
+            await response.prepare(request)
             
+            while camera.is_running and not self._shutdown.is_set():
+                try:
+                    # Time out now and then to notice stopped cameras and shutdown
+                    await asyncio.wait_for(frame_ready.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    continue
+                frame_ready.clear()
+                
+                # Shared with frame pollers and other viewers of this camera
+                latest = await self._latest_jpeg(camera)
+                if latest is not None:
+                    await response.write(MJPEG_PART_HEADER + latest[2] + b'\r\n')
+            
+        except ConnectionResetError:
+            # Client went away
+            pass
         except Exception as e:
-            self.logger.error(f"Error getting camera frame: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            self.logger.error(f"Error streaming camera {camera_id}: {e}")
+        finally:
+            camera.remove_frame_listener(notify)
+        
+        return response
     
     async def discover_cameras(self, request: web_request.BaseRequest) -> Response:
         """Discover ONVIF cameras on the network"""
         try:
-            from detection.rtsp_manager import ONVIFDiscovery
-            
-            data = await request.json() if request.content_length else {}
+            data = await request.json(loads=orjson.loads) if request.content_length else {}
             timeout = data.get('timeout', 5)
             
-            discovered_cameras = ONVIFDiscovery.discover_cameras(timeout)
+            # The multicast probe blocks for the whole timeout; keep it off the event loop
+            discovered_cameras = await asyncio.get_running_loop().run_in_executor(
+                None, self._get_rtsp_manager().discover_cameras, timeout
+            )
             
-            return web.json_response({
+            return orjson_response({
                 'cameras': discovered_cameras,
                 'count': len(discovered_cameras),
                 'timestamp': time.time()
@@ -303,101 +646,97 @@ class SentinelAPIServer:
             
         except Exception as e:
             self.logger.error(f"Error discovering cameras: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return orjson_response({'error': str(e)}, status=500)
     
+    @require_ready(cameras_ready, ERR_CAMERAS_NOT_INIT, "adding camera")
     async def add_camera(self, request: web_request.BaseRequest) -> Response:
         """Add a new RTSP camera"""
-        try:
-            data = await request.json()
-            
-            required_fields = ['camera_id', 'rtsp_url']
-            for field in required_fields:
-                if field not in data:
-                    return web.json_response({'error': f'Missing required field: {field}'}, status=400)
-            
-            if not self.sentinel_system or not self.sentinel_system.stream_processor:
-                return web.json_response({'error': 'Camera system not initialized'}, status=500)
-            
-            camera_id = data['camera_id']
-            rtsp_url = data['rtsp_url']
-            
-            # Check if camera already exists
-            existing_cameras = [cam.camera_id for cam in self.sentinel_system.stream_processor.simulator.cameras]
-            if camera_id in existing_cameras:
-                return web.json_response({'error': f'Camera {camera_id} already exists'}, status=400)
-            
-            # Test the RTSP connection first (skip for synthetic sources)
-            if rtsp_url not in ['synthetic', 'test']:
-                from detection.rtsp_manager import RTSPManager
-                manager = RTSPManager()
-                test_success, test_message = manager.test_rtsp_url(
-                    rtsp_url, 
-                    data.get('username'), 
-                    data.get('password')
-                )
-                
-                if not test_success:
-                    return web.json_response({
-                        'success': False,
-                        'error': f'Camera test failed: {test_message}'
-                    }, status=400)
-            
-            # Create camera profile and save to config
-            camera_profile = CameraProfile(
-                camera_id=camera_id,
-                name=data.get('name', f'Camera {camera_id}'),
-                rtsp_url=rtsp_url,
-                username=data.get('username'),
-                password=data.get('password'),
-                fps=data.get('fps', 30),
-                enabled=data.get('enabled', True),
-                location=data.get('location', 'Unknown')
-            )
-            
-            # Save to configuration
-            if not self.camera_config.add_camera(camera_profile):
-                return web.json_response({'error': 'Failed to save camera configuration'}, status=500)
-            
-            # Add camera to the simulator (for now, until full RTSP integration)
-            # Use the RTSP URL as the video source
-            camera = self.sentinel_system.stream_processor.simulator.add_camera(
-                camera_id, rtsp_url, fps=camera_profile.fps
+        data = await request.json(loads=orjson.loads)
+        
+        required_fields = ['camera_id', 'rtsp_url']
+        for field in required_fields:
+            if field not in data:
+                return orjson_response({'error': f'Missing required field: {field}'}, status=400)
+        
+        camera_id = data['camera_id']
+        rtsp_url = data['rtsp_url']
+        
+        # Check if camera already exists
+        if camera_id in self.sentinel_system.stream_processor.simulator.cameras_by_id:
+            return orjson_response({'error': f'Camera {camera_id} already exists'}, status=400)
+        
+        # Test the RTSP connection first (skip for synthetic sources)
+        if rtsp_url not in ['synthetic', 'test']:
+            # Opening the stream blocks for seconds; keep it off the event loop
+            test_success, test_message = await asyncio.get_running_loop().run_in_executor(
+                None,
+                self._get_rtsp_manager().test_rtsp_url,
+                rtsp_url, 
+                data.get('username'), 
+                data.get('password')
             )
             
-            # Start the camera
-            camera.start()
-            
-            # Camera added successfully
-            
-            return web.json_response({
-                'success': True,
-                'camera_id': camera_id,
-                'message': f'Camera {camera_id} added successfully'
-            })
-            
-        except Exception as e:
-            self.logger.error(f"Error adding camera: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            if not test_success:
+                return orjson_response({
+                    'success': False,
+                    'error': f'Camera test failed: {test_message}'
+                }, status=400)
+        
+        # Create camera profile and save to config
+        camera_profile = CameraProfile(
+            camera_id=camera_id,
+            name=data.get('name', f'Camera {camera_id}'),
+            rtsp_url=rtsp_url,
+            username=data.get('username'),
+            password=data.get('password'),
+            fps=data.get('fps', 30),
+            enabled=data.get('enabled', True),
+            location=data.get('location', 'Unknown')
+        )
+        
+        # Save to configuration
+        if not self.camera_config.add_camera(camera_profile):
+            return error_response(ERR_CAMERA_CONFIG_SAVE, status=500)
+        
+        # Add camera to the simulator (for now, until full RTSP integration)
+        # Use the RTSP URL as the video source
+        camera = self.sentinel_system.stream_processor.simulator.add_camera(
+            camera_id, rtsp_url, fps=camera_profile.fps
+        )
+        
+        # Start the camera
+        camera.start()
+        self._camera_static.pop(camera_id, None)
+        self._jpeg_cache.pop(camera_id, None)
+        self._invalidate_cache('cameras', 'status')
+        
+        # Camera added successfully
+        
+        return orjson_response({
+            'success': True,
+            'camera_id': camera_id,
+            'message': f'Camera {camera_id} added successfully'
+        })
     
     async def test_camera(self, request: web_request.BaseRequest) -> Response:
         """Test RTSP camera connection"""
         try:
             camera_id = request.match_info['camera_id']
-            data = await request.json()
+            data = await request.json(loads=orjson.loads)
             
             rtsp_url = data.get('rtsp_url')
             username = data.get('username')
             password = data.get('password')
             
             if not rtsp_url:
-                return web.json_response({'error': 'Missing rtsp_url'}, status=400)
-            
-            from detection.rtsp_manager import RTSPManager
+                return error_response(ERR_MISSING_RTSP_URL, status=400)
             
-            manager = RTSPManager()
-            success, message = manager.test_rtsp_url(rtsp_url, username, password)
+            # Opening the stream blocks for seconds; keep it off the event loop
+            success, message = await asyncio.get_running_loop().run_in_executor(
+                None, self._get_rtsp_manager().test_rtsp_url, rtsp_url, username, password
+            )
             
-            return web.json_response({
+            return orjson_response({
                 'camera_id': camera_id,
                 'success': success,
                 'message': message,
@@ -406,65 +745,60 @@ class SentinelAPIServer:
             
         except Exception as e:
             self.logger.error(f"Error testing camera: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return orjson_response({'error': str(e)}, status=500)
     
+    @require_ready(cameras_ready, ERR_CAMERAS_NOT_INIT, "removing camera")
     async def remove_camera(self, request: web_request.BaseRequest) -> Response:
         """Remove RTSP camera from system"""
-        try:
-            camera_id = request.match_info['camera_id']
-            
-            if not self.sentinel_system or not self.sentinel_system.stream_processor:
-                return web.json_response({'error': 'Camera system not initialized'}, status=500)
-            
-            # Remove camera from simulator
-            cameras_to_remove = []
-            for camera in self.sentinel_system.stream_processor.simulator.cameras:
-                if camera.camera_id == camera_id:
-                    cameras_to_remove.append(camera)
-            
-            if not cameras_to_remove:
-                return web.json_response({'error': f'Camera {camera_id} not found'}, status=404)
-            
-            # Stop and remove the camera
-            for camera in cameras_to_remove:
-                camera.stop()
-                self.sentinel_system.stream_processor.simulator.cameras.remove(camera)
-            
-            # Remove from configuration
-            self.camera_config.remove_camera(camera_id)
-            
-            # Camera removed successfully
-            
-            return web.json_response({
-                'success': True,
-                'camera_id': camera_id,
-                'message': f'Camera {camera_id} removed successfully',
-                'timestamp': time.time()
-            })
-            
-        except Exception as e:
-            self.logger.error(f"Error removing camera: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+        camera_id = request.match_info['camera_id']
+        
+        # Stop and remove the camera from the simulator
+        if not self.sentinel_system.stream_processor.simulator.remove_camera(camera_id):
+            return orjson_response({'error': f'Camera {camera_id} not found'}, status=404)
+        
+        # Remove from configuration
+        self._camera_static.pop(camera_id, None)
+        self._jpeg_cache.pop(camera_id, None)
+        self._invalidate_cache('cameras', 'status')
+        if camera_id in self.camera_config.cameras and not self.camera_config.remove_camera(camera_id):
+            return error_response(ERR_CAMERA_CONFIG_SAVE, status=500)
+        
+        # Camera removed successfully
+        
+        return orjson_response({
+            'success': True,
+            'camera_id': camera_id,
+            'message': f'Camera {camera_id} removed successfully',
+            'timestamp': time.time()
+        })
     
     async def get_system_metrics(self, request: web_request.BaseRequest) -> Response:
         """Get real system performance metrics"""
         try:
-            # Get real system metrics
-            metrics = system_monitor.get_system_metrics()
-            
-            # Add detection performance metrics if backend is running
-            if self.sentinel_system and hasattr(self.sentinel_system, 'frames_processed'):
-                detection_metrics = system_monitor.get_detection_performance_metrics(
-                    frames_processed=getattr(self.sentinel_system, 'frames_processed', 0),
-                    detections_made=getattr(self.sentinel_system, 'detections_made', 0)
-                )
-                metrics['detection_performance'] = detection_metrics
-            
-            return web.json_response(metrics)
+            # psutil and nvidia-smi calls block; collect them on a worker thread
+            return await self._cached_json(
+                request, 'metrics', 1.0, lambda: asyncio.to_thread(self._build_system_metrics)
+            )
             
         except Exception as e:
             self.logger.error(f"Error getting system metrics: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return orjson_response({'error': str(e)}, status=500)
+    
+    def _build_system_metrics(self) -> Dict[str, Any]:
+        """Collect system and detection performance metrics"""
+        # Get real system metrics
+        metrics = system_monitor.get_system_metrics()
+        
+        # Add detection performance metrics if backend is running
+        ss = self.sentinel_system
+        if ss:
+            detection_metrics = system_monitor.get_detection_performance_metrics(
+                frames_processed=ss.frames_processed,
+                detections_made=ss.detections_made
+            )
+            metrics['detection_performance'] = detection_metrics
+        
+        return metrics
     
     async def start_backend_system(self):
         """Start the Sentinel backend system"""
@@ -478,11 +812,15 @@ class SentinelAPIServer:
             # Create API handler
             self.api_handler = APIServer(self.sentinel_system)
             
-            # Start the backend in a separate task
-            asyncio.create_task(self.sentinel_system.start())
+            # Start the backend in a separate task, keeping a reference so it isn't collected
+            self._backend_task = asyncio.create_task(self.sentinel_system.start())
             
-            # Give it time to initialize
-            await asyncio.sleep(2)
+            # Wait until it has initialized, or surface its error if startup fails
+            ready = asyncio.create_task(self.sentinel_system.wait_ready())
+            await asyncio.wait({ready, self._backend_task}, return_when=asyncio.FIRST_COMPLETED)
+            if not ready.done():
+                ready.cancel()
+                self._backend_task.result()
             
             # Load cameras from configuration
             await self._load_cameras_from_config()
@@ -526,36 +864,69 @@ class SentinelAPIServer:
             # Start backend system first
             await self.start_backend_system()
             
+            # Installed after the backend has started, as SentinelSystem.start
+            # registers its own handlers
+            self._install_signal_handlers()
+            
             # Start web server
-            runner = web.AppRunner(self.app)
-            await runner.setup()
+            # No per-request access log lines for the polling frontend, and keep its
+            # connections open between polls
+            self._runner = web.AppRunner(self.app, access_log=None, keepalive_timeout=75)
+            await self._runner.setup()
             
-            site = web.TCPSite(runner, 'localhost', self.port)
+            site = web.TCPSite(self._runner, 'localhost', self.port)
             await site.start()
             
             self.is_running = True
             print(f"API Server running on http://localhost:{self.port}")
             
-            # Keep server running
-            while self.is_running:
-                await asyncio.sleep(1)
+            # Keep server running until shutdown is requested
+            await self._shutdown.wait()
                 
         except Exception as e:
             self.logger.error(f"Failed to start API server: {e}")
             raise
     
-    def stop_server(self):
+    def _install_signal_handlers(self):
+        """Route SIGINT/SIGTERM to the shutdown event"""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.request_shutdown)
+            except NotImplementedError:
+                # Windows event loops have no add_signal_handler
+                signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(self.request_shutdown))
+    
+    def request_shutdown(self):
+        """Ask start_server to return so the server can be stopped"""
+        print("Shutdown requested, stopping...")
+        self._shutdown.set()
+    
+    async def stop_server(self):
         """Stop the API server"""
         # Stopping API server
         self.is_running = False
+        self._shutdown.set()
+        
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
         
         if self.sentinel_system:
-            asyncio.create_task(self.sentinel_system.stop())
-
-def signal_handler(signum, frame):
-    """Handle shutdown signals"""
-    print(f"Received signal {signum}, shutting down...")
-    sys.exit(0)
+            await self.sentinel_system.stop()
+        
+        # Retry any camera changes whose save failed earlier
+        self.camera_config.flush()
+        
+        # The main loop exits on its next tick once is_running is cleared
+        if self._backend_task:
+            await asyncio.gather(self._backend_task, return_exceptions=True)
+            self._backend_task = None
+        
+        # Flush queued log records last so shutdown messages aren't lost
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
 
 async def main():
     """Main entry point"""
@@ -566,10 +937,6 @@ async def main():
     for directory in ['logs', 'data', 'test_data', 'models']:
         Path(directory).mkdir(exist_ok=True)
     
-    # Setup signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
     # Create and start API server
     api_server = SentinelAPIServer()
     
@@ -580,20 +947,16 @@ async def main():
     except Exception as e:
         print(f"API Server error: {e}")
     finally:
-        api_server.stop_server()
+        await api_server.stop_server()
         print("API Server stopped")
 
 if __name__ == "__main__":
-    # Install aiohttp if not present
+    # Use libuv's event loop where available (not on Windows)
     try:
-        import aiohttp
-        import aiohttp_cors
+        import uvloop
+        uvloop.install()
     except ImportError:
-        print("Installing required packages...")
-        import subprocess
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "aiohttp", "aiohttp-cors"])
-        import aiohttp
-        import aiohttp_cors
+        pass
     
     # Run the API server
     asyncio.run(main())
\ No newline at end of file
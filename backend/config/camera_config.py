@@ -5,15 +5,61 @@ Handles RTSP camera setup, ONVIF discovery, and configuration persistence
 
 import yaml
 import json
+import orjson
+import atexit
+import os
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import errno
 import ipaddress
+import selectors
 import socket
 import threading
 import time
+import weakref
+from urllib.parse import urlparse
+try:
+    from .yaml_cache import YAML_DUMPER, load_yaml_cached
+except ImportError:
+    from config.yaml_cache import YAML_DUMPER, load_yaml_cached
+
+# Written camera configs are JSON; YAML is still read for hand-edited and older files
+ORJSON_OPTIONS = orjson.OPT_INDENT_2
+
+# Connects kept in flight at once by the port scanner (bounded by open file limits)
+PORT_SCAN_BATCH_SIZE = 256
+
+# Private ranges guessed when the local interfaces can't be enumerated
+FALLBACK_NETWORKS = ['192.168.1.0/24', '192.168.0.0/24', '10.0.0.0/24']
+
+# Seconds to collect WS-Discovery replies after the multicast probe
+ONVIF_PROBE_TIMEOUT = 2
+
+# RTSP replies that show a stream is served at the URL (401 = exists, needs credentials)
+RTSP_STREAM_STATUSES = (200, 401)
+
+# Seconds a saved discovery result is reused for the same network ranges
+DISCOVERY_CACHE_TTL = 300
+
+def _write_private_file(path: Path, content: bytes):
+    """Write a file readable only by its owner, since camera configs hold credentials"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        if hasattr(os, 'fchmod'):
+            # The mode above only applies to new files; tighten existing ones too
+            os.fchmod(f.fileno(), 0o600)
+        f.write(content)
+
+def _flush_at_exit(manager_ref: "weakref.ref[CameraConfigManager]"):
+    """Write a camera config manager's pending changes if it is still alive"""
+    manager = manager_ref()
+    if manager is not None:
+        manager.flush()
 
 @dataclass
 class CameraProfile:
@@ -32,6 +78,31 @@ class CameraProfile:
     def __post_init__(self):
         if self.detection_zones is None:
             self.detection_zones = []
+    
+    def __setattr__(self, name, value):
+        # Assigning any field invalidates the dict cached by to_dict()
+        object.__setattr__(self, '_cached_dict', None)
+        object.__setattr__(self, name, value)
+    
+    def to_dict(self) -> Dict:
+        """Serializable form of the profile, cached until a field is reassigned
+        
+        The returned dict is shared with the cache and must not be modified.
+        """
+        if self._cached_dict is None:
+            object.__setattr__(self, '_cached_dict', {
+                'camera_id': self.camera_id,
+                'name': self.name,
+                'rtsp_url': self.rtsp_url,
+                'username': self.username,
+                'password': self.password,
+                'fps': self.fps,
+                'resolution': list(self.resolution),
+                'enabled': self.enabled,
+                'location': self.location,
+                'detection_zones': [[list(point) for point in zone] for zone in self.detection_zones]
+            })
+        return self._cached_dict
 
 @dataclass
 class NetworkScan:
@@ -46,51 +117,113 @@ class CameraConfigManager:
     
     def __init__(self, config_file: str = "config/cameras.yaml"):
         self.config_file = Path(config_file)
+        self.json_config_file = self.config_file.with_suffix('.json')
         self.logger = logging.getLogger(__name__)
         self.cameras: Dict[str, CameraProfile] = {}
         self.discovered_devices: List[Dict] = []
+        self._discovery_cache_path = self.config_file.parent / ".discovery_cache.json"
+        
+        # Camera changes are written as they are made, except inside batch(),
+        # which collects them into a single write on exit
+        self._batch_depth = 0
+        self._dirty = False
+        self._save_lock = threading.Lock()
+        
         self.load_config()
+        # Held weakly so the exit hook doesn't keep every manager alive
+        atexit.register(_flush_at_exit, weakref.ref(self))
     
     def load_config(self):
         """Load camera configurations from file"""
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    data = yaml.safe_load(f)
-                    if data and 'cameras' in data:
-                        for cam_data in data['cameras']:
-                            profile = CameraProfile(**cam_data)
-                            self.cameras[profile.camera_id] = profile
-                        self.logger.info(f"Loaded {len(self.cameras)} camera configurations")
+            source = self._newest_config_file()
+            if source:
+                data = self._read_config_file(source)
+                if data and 'cameras' in data:
+                    for cam_data in data['cameras']:
+                        profile = CameraProfile(**cam_data)
+                        self.cameras[profile.camera_id] = profile
+                    self.logger.info(f"Loaded {len(self.cameras)} camera configurations")
             else:
                 self.logger.info("No camera config file found, starting with empty configuration")
         except Exception as e:
             self.logger.error(f"Failed to load camera config: {e}")
     
-    def save_config(self):
+    def _newest_config_file(self) -> Optional[Path]:
+        """Pick the saved JSON config unless the YAML file was edited after it"""
+        if not self.json_config_file.exists():
+            return self.config_file if self.config_file.exists() else None
+        if self.config_file.exists() and self.config_file.stat().st_mtime > self.json_config_file.stat().st_mtime:
+            return self.config_file
+        return self.json_config_file
+    
+    def _read_config_file(self, path: Path) -> Optional[Dict]:
+        """Parse a camera config file as JSON or YAML based on its extension"""
+        path = Path(path)
+        if path.suffix == '.json':
+            return orjson.loads(path.read_bytes())
+        return load_yaml_cached(path)
+    
+    @contextmanager
+    def batch(self):
+        """Defer config writes made inside the block to a single save when it exits"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+    
+    def _save_changes(self) -> bool:
+        """Mark the config dirty and write it unless a batch() is collecting changes
+        
+        Returns False only when the write was attempted and failed.
+        """
+        with self._save_lock:
+            self._dirty = True
+            if self._batch_depth:
+                return True
+        return self.flush()
+    
+    def flush(self) -> bool:
+        """Write pending camera changes to file now"""
+        with self._save_lock:
+            if not self._dirty:
+                return True
+            self._dirty = False
+            if not self.save_config():
+                # Keep the changes pending so the next change, flush or exit retries them
+                self._dirty = True
+                return False
+            return True
+    
+    def save_config(self) -> bool:
         """Save camera configurations to file"""
         try:
             # Ensure config directory exists
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
+            self.json_config_file.parent.mkdir(parents=True, exist_ok=True)
             
             # Convert to serializable format
             config_data = {
-                'cameras': [asdict(camera) for camera in self.cameras.values()],
+                'cameras': [camera.to_dict() for camera in self.cameras.values()],
                 'last_updated': datetime.now().isoformat()
             }
             
-            with open(self.config_file, 'w') as f:
-                yaml.dump(config_data, f, default_flow_style=False, indent=2)
+            _write_private_file(self.json_config_file, orjson.dumps(config_data, option=ORJSON_OPTIONS))
             
             self.logger.info(f"Saved {len(self.cameras)} camera configurations")
+            return True
         except Exception as e:
             self.logger.error(f"Failed to save camera config: {e}")
+            return False
     
     def add_camera(self, profile: CameraProfile) -> bool:
         """Add a camera profile"""
         try:
             self.cameras[profile.camera_id] = profile
-            self.save_config()
+            if not self._save_changes():
+                return False
             self.logger.info(f"Added camera: {profile.camera_id} ({profile.name})")
             return True
         except Exception as e:
@@ -101,7 +234,8 @@ class CameraConfigManager:
         """Remove a camera profile"""
         if camera_id in self.cameras:
             del self.cameras[camera_id]
-            self.save_config()
+            if not self._save_changes():
+                return False
             self.logger.info(f"Removed camera: {camera_id}")
             return True
         return False
@@ -129,17 +263,38 @@ class CameraConfigManager:
                 if hasattr(camera, key):
                     setattr(camera, key, value)
             
-            self.save_config()
+            if not self._save_changes():
+                return False
             self.logger.info(f"Updated camera {camera_id}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to update camera {camera_id}: {e}")
             return False
     
-    def discover_network_cameras(self, ip_ranges: List[str] = None, timeout: int = 5) -> List[Dict]:
+    def discover_network_cameras(self, ip_ranges: List[str] = None, timeout: int = 5,
+                                 max_threads: int = 50, use_onvif: bool = True,
+                                 use_cache: bool = True) -> List[Dict]:
         """Discover cameras on the network"""
+        guessed_ranges = False
         if ip_ranges is None:
             ip_ranges = self._get_local_networks()
+            guessed_ranges = ip_ranges == FALLBACK_NETWORKS
+        
+        cache_key = {'ip_ranges': sorted(ip_ranges), 'use_onvif': use_onvif}
+        if use_cache:
+            cached = self._load_discovery_cache(cache_key)
+            if cached is not None:
+                self.discovered_devices = cached
+                self.logger.info(f"Using {len(cached)} cached camera discovery results")
+                return cached
+        
+        # ONVIF cameras announce themselves to a single multicast probe
+        onvif_hosts = self._discover_onvif_hosts() if use_onvif else []
+        
+        if guessed_ranges and onvif_hosts:
+            # The fallback ranges are only a guess; trust the devices that answered
+            self.logger.info(f"Found {len(onvif_hosts)} ONVIF devices, skipping guessed network sweep")
+            ip_ranges = []
         
         self.logger.info(f"Scanning for cameras on networks: {ip_ranges}")
         discovered = []
@@ -151,20 +306,62 @@ class CameraConfigManager:
             '/h264Preview_01_main', '/video1', '/media', '/onvif1'
         ]
         
-        # Scan each IP range
+        # Collect every host to probe, ONVIF responders first, then the requested ranges
+        hosts = list(onvif_hosts)
+        seen = set(onvif_hosts)
         for ip_range in ip_ranges:
             try:
                 network = ipaddress.ip_network(ip_range, strict=False)
                 for ip in network.hosts():
-                    devices = self._scan_ip_for_cameras(str(ip), common_ports, common_paths, timeout)
-                    discovered.extend(devices)
+                    ip = str(ip)
+                    if ip not in seen:
+                        seen.add(ip)
+                        hosts.append(ip)
             except Exception as e:
                 self.logger.error(f"Error scanning {ip_range}: {e}")
         
+        # Find open ports with non-blocking connects, then fan the slower RTSP
+        # path probes out over threads
+        open_ports = self._scan_ports_batch([(ip, port) for ip in hosts for port in common_ports], timeout)
+        
+        with ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="camera-scan") as executor:
+            probes = [executor.submit(self._probe_rtsp_paths, ip, port, common_paths, timeout)
+                      for ip, port in open_ports]
+            for probe in probes:
+                device = probe.result()
+                if device:
+                    if device['ip'] in onvif_hosts:
+                        device['type'] = 'ONVIF Camera'
+                    discovered.append(device)
+        
         self.discovered_devices = discovered
+        self._save_discovery_cache(cache_key, discovered)
         self.logger.info(f"Discovered {len(discovered)} potential camera devices")
         return discovered
     
+    def _load_discovery_cache(self, cache_key: Dict) -> Optional[List[Dict]]:
+        """Get saved discovery results for the same scan if they are still fresh"""
+        try:
+            if time.time() - self._discovery_cache_path.stat().st_mtime > DISCOVERY_CACHE_TTL:
+                return None
+            with open(self._discovery_cache_path, 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if cached.get('key') != cache_key:
+            return None
+        return cached.get('devices')
+    
+    def _save_discovery_cache(self, cache_key: Dict, devices: List[Dict]):
+        """Save discovery results so repeat scans of the same ranges can skip the network"""
+        try:
+            self._discovery_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._discovery_cache_path, 'w') as f:
+                json.dump({'key': cache_key, 'devices': devices, 'timestamp': time.time()}, f)
+        except OSError as e:
+            self.logger.warning(f"Failed to save discovery cache: {e}")
+    
     def _get_local_networks(self) -> List[str]:
         """Get local network ranges"""
         networks = []
@@ -181,58 +378,120 @@ class CameraConfigManager:
                                 networks.append(f"{ip}/{netmask}")
         except ImportError:
             # Fallback to common private networks
-            networks = ['192.168.1.0/24', '192.168.0.0/24', '10.0.0.0/24']
+            networks = list(FALLBACK_NETWORKS)
         
         return networks
     
-    def _scan_ip_for_cameras(self, ip: str, ports: List[int], paths: List[str], timeout: int) -> List[Dict]:
-        """Scan a specific IP for camera services"""
-        devices = []
-        
-        for port in ports:
-            if self._is_port_open(ip, port, timeout):
-                # Found open port, test for RTSP
-                for path in paths:
-                    rtsp_url = f"rtsp://{ip}:{port}{path}"
-                    if self._test_rtsp_stream(rtsp_url, timeout):
-                        device = {
-                            'ip': ip,
-                            'port': port,
-                            'rtsp_url': rtsp_url,
-                            'type': 'RTSP Camera',
-                            'discovered_time': datetime.now().isoformat(),
-                            'path': path
-                        }
-                        devices.append(device)
-                        break  # Found working stream, move to next port
-        
-        return devices
+    def _discover_onvif_hosts(self) -> List[str]:
+        """Get the IPs of ONVIF devices answering a WS-Discovery probe"""
+        try:
+            try:
+                from ..detection.rtsp_manager import ONVIFDiscovery
+            except ImportError:
+                from detection.rtsp_manager import ONVIFDiscovery
+        except ImportError as e:
+            self.logger.warning(f"ONVIF discovery unavailable: {e}")
+            return []
+        
+        hosts = []
+        for device in ONVIFDiscovery.discover_cameras(ONVIF_PROBE_TIMEOUT):
+            if device['ip'] not in hosts:
+                hosts.append(device['ip'])
+        return hosts
+    
+    def _probe_rtsp_paths(self, ip: str, port: int, paths: List[str], timeout: int) -> Optional[Dict]:
+        """Return the first working RTSP stream on an open port, if any"""
+        # OPTIONS doesn't depend on the path, so rule out non-RTSP services once
+        if self._rtsp_request(f"rtsp://{ip}:{port}", 'OPTIONS', timeout) is None:
+            return None
+        
+        for path in paths:
+            rtsp_url = f"rtsp://{ip}:{port}{path}"
+            if self._test_rtsp_stream(rtsp_url, timeout):
+                return {
+                    'ip': ip,
+                    'port': port,
+                    'rtsp_url': rtsp_url,
+                    'type': 'RTSP Camera',
+                    'discovered_time': datetime.now().isoformat(),
+                    'path': path
+                }
+        return None
     
     def _is_port_open(self, ip: str, port: int, timeout: int) -> bool:
         """Check if a port is open on the given IP"""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            result = sock.connect_ex((ip, port))
-            sock.close()
-            return result == 0
-        except:
-            return False
+        return bool(self._scan_ports_batch([(ip, port)], timeout))
+    
+    def _scan_ports_batch(self, targets: List[Tuple[str, int]], timeout: float) -> List[Tuple[str, int]]:
+        """Return the (ip, port) targets accepting TCP connections, in input order
+        
+        Connects are issued non-blocking and supervised by a single selector, so
+        refused ports drop out after one round trip and only filtered ports wait
+        out the timeout.
+        """
+        open_targets = set()
+        
+        for start in range(0, len(targets), PORT_SCAN_BATCH_SIZE):
+            selector = selectors.DefaultSelector()
+            try:
+                for target in targets[start:start + PORT_SCAN_BATCH_SIZE]:
+                    try:
+                        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    except OSError as e:
+                        self.logger.error(f"Port scan socket error: {e}")
+                        break
+                    try:
+                        sock.setblocking(False)
+                        result = sock.connect_ex(target)
+                    except OSError:
+                        result = errno.EINVAL
+                    if result in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                        selector.register(sock, selectors.EVENT_WRITE, target)
+                    else:
+                        sock.close()
+                
+                deadline = time.monotonic() + timeout
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    for key, _ in selector.select(remaining):
+                        sock = key.fileobj
+                        if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                            open_targets.add(key.data)
+                        selector.unregister(sock)
+                        sock.close()
+            finally:
+                for key in list(selector.get_map().values()):
+                    key.fileobj.close()
+                selector.close()
+        
+        return [target for target in targets if target in open_targets]
     
     def _test_rtsp_stream(self, rtsp_url: str, timeout: int) -> bool:
         """Test if RTSP stream is accessible"""
+        # A DESCRIBE round trip is enough to tell whether the stream exists; the
+        # full decode check is left to test_camera_connection
+        return self._rtsp_request(rtsp_url, 'DESCRIBE', timeout) in RTSP_STREAM_STATUSES
+    
+    def _rtsp_request(self, rtsp_url: str, method: str, timeout: float) -> Optional[int]:
+        """Send a bare RTSP request and return the reply's status code, or None if not RTSP"""
+        parsed = urlparse(rtsp_url)
+        request = (f"{method} {rtsp_url} RTSP/1.0\r\n"
+                   "CSeq: 1\r\n"
+                   "User-Agent: Sentinel\r\n"
+                   "Accept: application/sdp\r\n\r\n")
+        
         try:
-            import cv2
-            cap = cv2.VideoCapture(rtsp_url)
-            cap.set(cv2.CAP_PROP_TIMEOUT, timeout * 1000)  # OpenCV timeout in milliseconds
-            
-            if cap.isOpened():
-                ret, frame = cap.read()
-                cap.release()
-                return ret and frame is not None
-            return False
-        except:
-            return False
+            with socket.create_connection((parsed.hostname, parsed.port or 554), timeout=timeout) as sock:
+                sock.sendall(request.encode())
+                status_line = sock.recv(512).split(b'\r\n', 1)[0].split()
+        except (OSError, ValueError):
+            return None
+        
+        if len(status_line) >= 2 and status_line[0].startswith(b'RTSP/') and status_line[1].isdigit():
+            return int(status_line[1])
+        return None
     
     def create_profile_from_discovery(self, discovered_device: Dict, name: str, camera_id: str = None) -> CameraProfile:
         """Create a camera profile from discovered device"""
@@ -289,7 +548,7 @@ class CameraConfigManager:
         """Export configuration to file"""
         if export_path is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            export_path = f"camera_config_export_{timestamp}.yaml"
+            export_path = f"camera_config_export_{timestamp}.json"
         
         try:
             export_data = {
@@ -298,11 +557,15 @@ class CameraConfigManager:
                     'camera_count': len(self.cameras),
                     'system': 'Sentinel Fire Detection'
                 },
-                'cameras': [asdict(camera) for camera in self.cameras.values()]
+                'cameras': [camera.to_dict() for camera in self.cameras.values()]
             }
             
-            with open(export_path, 'w') as f:
-                yaml.dump(export_data, f, default_flow_style=False, indent=2)
+            # JSON unless a YAML file was asked for explicitly
+            if Path(export_path).suffix in ('.yaml', '.yml'):
+                content = yaml.dump(export_data, Dumper=YAML_DUMPER, default_flow_style=False, indent=2).encode()
+            else:
+                content = orjson.dumps(export_data, option=ORJSON_OPTIONS)
+            _write_private_file(Path(export_path), content)
             
             self.logger.info(f"Exported configuration to {export_path}")
             return export_path
@@ -313,8 +576,7 @@ class CameraConfigManager:
     def import_config(self, import_path: str, merge: bool = False) -> bool:
         """Import configuration from file"""
         try:
-            with open(import_path, 'r') as f:
-                data = yaml.safe_load(f)
+            data = self._read_config_file(import_path)
             
             if not merge:
                 self.cameras.clear()
@@ -328,7 +590,8 @@ class CameraConfigManager:
                 except Exception as e:
                     self.logger.warning(f"Skipped invalid camera config: {e}")
             
-            self.save_config()
+            if not self._save_changes():
+                return False
             self.logger.info(f"Imported {imported_count} camera configurations")
             return True
             
@@ -351,23 +614,24 @@ class CameraWizard:
         discovered = self.config_manager.discover_network_cameras()
         
         profiles = []
-        for i, device in enumerate(discovered):
-            # Create basic profile
-            camera_id = f"auto_cam_{i+1}"
-            name = f"Camera {device['ip']}:{device['port']}"
-            
-            profile = self.config_manager.create_profile_from_discovery(
-                device, name, camera_id
-            )
-            
-            # Test connection
-            success, message = self.config_manager.test_camera_connection(profile)
-            if success:
-                self.config_manager.add_camera(profile)
-                profiles.append(profile)
-                self.logger.info(f"Auto-configured camera: {profile.name}")
-            else:
-                self.logger.warning(f"Skipped {profile.name}: {message}")
+        with self.config_manager.batch():
+            for i, device in enumerate(discovered):
+                # Create basic profile
+                camera_id = f"auto_cam_{i+1}"
+                name = f"Camera {device['ip']}:{device['port']}"
+                
+                profile = self.config_manager.create_profile_from_discovery(
+                    device, name, camera_id
+                )
+                
+                # Test connection
+                success, message = self.config_manager.test_camera_connection(profile)
+                if success:
+                    self.config_manager.add_camera(profile)
+                    profiles.append(profile)
+                    self.logger.info(f"Auto-configured camera: {profile.name}")
+                else:
+                    self.logger.warning(f"Skipped {profile.name}: {message}")
         
         return profiles
     
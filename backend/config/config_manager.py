@@ -8,8 +8,16 @@ import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime
+try:
+    from .yaml_cache import YAML_DUMPER, YAML_LOADER, invalidate_yaml_cache, load_yaml_cached
+except ImportError:
+    from config.yaml_cache import YAML_DUMPER, YAML_LOADER, invalidate_yaml_cache, load_yaml_cached
+
+# Minimum seconds between config file stat() checks on the getter path
+STAT_CHECK_INTERVAL = 1.0
 
 @dataclass
 class DetectionConfig:
@@ -61,8 +69,10 @@ class ConfigManager:
                     self.config_path = project_root
         
         self.logger = logging.getLogger(__name__)
-        self._config_cache = {}
+        # Seeded with defaults so the getters can index it directly
+        self._config_cache = self._default_config()
         self._last_modified = 0
+        self._next_stat_check = 0.0
         
         self.logger.info(f"Config manager using path: {self.config_path.absolute()}")
         
@@ -71,6 +81,11 @@ class ConfigManager:
     
     def reload_config(self) -> bool:
         """Reload configuration from file if changed"""
+        now = time.monotonic()
+        if now < self._next_stat_check:
+            return False
+        self._next_stat_check = now + STAT_CHECK_INTERVAL
+        
         try:
             if not self.config_path.exists():
                 self.logger.warning(f"Config file not found: {self.config_path}")
@@ -82,8 +97,7 @@ class ConfigManager:
                 return False  # No changes
             
             # Load configuration
-            with open(self.config_path, 'r') as f:
-                raw_config = yaml.safe_load(f)
+            raw_config = load_yaml_cached(self.config_path)
             
             # Validate and structure configuration
             self._config_cache = self._validate_config(raw_config)
@@ -94,9 +108,6 @@ class ConfigManager:
             
         except Exception as e:
             self.logger.error(f"Failed to reload config: {e}")
-            if not self._config_cache:
-                # Use defaults if no config loaded yet
-                self._config_cache = self._default_config()
             return False
     
     def _validate_config(self, raw_config: dict) -> dict:
@@ -204,24 +215,25 @@ alerts:
     def get_detection_config(self) -> DetectionConfig:
         """Get detection configuration"""
         self.reload_config()  # Check for updates
-        return self._config_cache.get('detection', DetectionConfig())
+        return self._config_cache['detection']
     
     def get_system_config(self) -> SystemConfig:
         """Get system configuration"""
         self.reload_config()
-        return self._config_cache.get('system', SystemConfig())
+        return self._config_cache['system']
     
     def get_alert_config(self) -> AlertConfig:
         """Get alert configuration"""
         self.reload_config()
-        return self._config_cache.get('alerts', AlertConfig())
+        return self._config_cache['alerts']
     
     def update_threshold(self, threshold_name: str, value: float) -> bool:
         """Update a detection threshold and save to file"""
         try:
-            # Load current config
+            # Read the file itself, not the stat-keyed cache: a previous update within
+            # the same mtime tick can leave a same-sized file the cache still matches
             with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=YAML_LOADER) or {}
             
             # Update threshold
             if 'detection' not in config:
@@ -232,11 +244,17 @@ alerts:
             config['detection']['thresholds'][threshold_name] = value
             
             # Validate updated config
-            self._validate_config(config)
+            validated = self._validate_config(config)
             
             # Save back to file
             with open(self.config_path, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False, indent=2)
+                yaml.dump(config, f, Dumper=YAML_DUMPER, default_flow_style=False, indent=2)
+            invalidate_yaml_cache(self.config_path)
+            
+            # Serve the new values right away; reload_config can't be relied on to
+            # notice a rewrite that kept the previous mtime
+            self._config_cache = validated
+            self._last_modified = self.config_path.stat().st_mtime
             
             self.logger.info(f"Updated {threshold_name} to {value}")
             return True
@@ -0,0 +1,57 @@
+"""
+YAML Loading Helpers
+Shared libyaml loader/dumper selection and a parse cache keyed on file stat
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Union
+
+import yaml
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Parsed documents kept by resolved path, evicted least-recently-used first
+YAML_CACHE_SIZE = 64
+
+_yaml_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_yaml_cache_lock = threading.Lock()
+
+def load_yaml_cached(path: Union[str, Path]) -> Any:
+    """Load a YAML file, reusing the last parse while its mtime and size are unchanged
+    
+    Returns a deep copy so callers can modify the result freely.
+    """
+    path = Path(path)
+    stat = path.stat()
+    key = str(path.resolve())
+    
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _yaml_cache.move_to_end(key)
+            return copy.deepcopy(cached[2])
+    
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=YAML_LOADER)
+    
+    with _yaml_cache_lock:
+        _yaml_cache[key] = (stat.st_mtime_ns, stat.st_size, data)
+        _yaml_cache.move_to_end(key)
+        while len(_yaml_cache) > YAML_CACHE_SIZE:
+            _yaml_cache.popitem(last=False)
+    
+    return copy.deepcopy(data)
+
+def invalidate_yaml_cache(path: Union[str, Path]):
+    """Drop the cached parse of a file, e.g. after rewriting it
+    
+    A rewrite within the filesystem's timestamp granularity that keeps the
+    size unchanged would otherwise still match the old entry.
+    """
+    with _yaml_cache_lock:
+        _yaml_cache.pop(str(Path(path).resolve()), None)
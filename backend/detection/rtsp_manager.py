@@ -14,7 +14,6 @@ from queue import Queue, Empty
 from dataclasses import dataclass
 from urllib.parse import urlparse
 import socket
-import requests
 import xml.etree.ElementTree as ET
 
 @dataclass
@@ -32,6 +32,14 @@ class SentinelSystem:
         self.stream_processor = None
         self.is_running = False
         
+        # Runtime counters read by the API server's status and metrics endpoints
+        self.start_time = time.time()
+        self.frames_processed = 0
+        self.detections_made = 0
+        
+        # Set once components are initialized, so callers can await startup
+        self._backend_ready = asyncio.Event()
+        
         self.logger.info("Sentinel System initialized")
     
     def _setup_logging(self) -> logging.Logger:
@@ -64,12 +72,17 @@ class SentinelSystem:
             
             # Start main processing loop
             self.is_running = True
+            self._backend_ready.set()
             await self._main_loop()
             
         except Exception as e:
             self.logger.error(f"Failed to start Sentinel system: {e}")
             raise
     
+    async def wait_ready(self):
+        """Wait until start() has initialized the components and entered the main loop"""
+        await self._backend_ready.wait()
+    
     async def _initialize_components(self):
         """Initialize all system components"""
         # Load configuration
@@ -98,6 +111,9 @@ class SentinelSystem:
             try:
                 # Run fire detection on frame
                 detection_result = self.fire_detector.detect_fire(frame)
+                self.frames_processed += 1
+                if detection_result.detections:
+                    self.detections_made += 1
                 
                 # Create alert if detection found
                 if detection_result.alert_level != 'None':
@@ -231,6 +247,23 @@ class APIServer:
             self.logger.error(f"Full traceback: {traceback.format_exc()}")
             return {'error': str(e)}
     
+    async def aget_dashboard_data(self) -> Dict[str, Any]:
+        """Get dashboard data without blocking the event loop on alert queries"""
+        try:
+            camera_count = 0
+            if self.sentinel.stream_processor:
+                camera_count = len(self.sentinel.stream_processor.get_camera_status())
+            
+            return {
+                'alerts': await self.sentinel.alert_manager.aget_dashboard_data(camera_count),
+                'config': self.sentinel.config_manager.get_config_summary(),
+                'timestamp': time.time()
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Failed to get dashboard data: {e}")
+            return {'error': str(e)}
+    
     def update_threshold(self, threshold_name: str, value: float) -> bool:
         """Update detection threshold"""
         try:
@@ -14,11 +14,20 @@ class SystemMonitor:
         self._last_net_io = None
         self._last_net_time = None
         
+        # CPU usage is measured between calls instead of sleeping for a sample window;
+        # the first call only sets the baseline, so make it here
+        self._process = psutil.Process()
+        psutil.cpu_percent(interval=None)
+        self._process.cpu_percent(interval=None)
+        
+        # Cleared once nvidia-smi turns out to be missing, so it isn't spawned on every poll
+        self._gpu_available = True
+        
     def get_system_metrics(self) -> Dict:
         """Get real system performance metrics"""
         try:
             # CPU metrics
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            cpu_percent = psutil.cpu_percent(interval=None)
             cpu_count = psutil.cpu_count()
             
             # Memory metrics
@@ -38,9 +47,9 @@ class SystemMonitor:
             network_latency = self._estimate_network_latency()
             
             # Process-specific metrics
-            process = psutil.Process()
+            process = self._process
             process_memory_mb = process.memory_info().rss / (1024 ** 2)
-            process_cpu_percent = process.cpu_percent(interval=0.1)
+            process_cpu_percent = process.cpu_percent(interval=None)
             
             # GPU metrics (if available)
             gpu_metrics = self._get_gpu_metrics()
@@ -120,6 +129,9 @@ class SystemMonitor:
     
     def _get_gpu_metrics(self) -> Optional[Dict]:
         """Get GPU metrics if NVIDIA GPU is available"""
+        if not self._gpu_available:
+            return None
+        
         try:
             import subprocess
             
@@ -137,6 +149,8 @@ class SystemMonitor:
                         'memory_total_mb': float(values[2]),
                         'temperature_c': float(values[3])
                     }
+        except FileNotFoundError:
+            self._gpu_available = False
         except Exception:
             pass
         
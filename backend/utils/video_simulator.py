@@ -8,7 +8,7 @@ import numpy as np
 import time
 import threading
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import Dict, Optional, Callable, Tuple
 import logging
 from queue import Queue
 
@@ -25,6 +25,9 @@ class CameraSimulator:
         self.frame_count = 0
         self.logger = logging.getLogger(f"Camera-{camera_id}")
         
+        # Called from the camera thread after each new frame (e.g. MJPEG streams)
+        self._frame_listeners: tuple = ()
+        
     def start(self):
         """Start the camera simulation"""
         self.is_running = True
@@ -43,6 +46,25 @@ class CameraSimulator:
         """Get the current frame"""
         return self.current_frame
     
+    def add_frame_listener(self, listener: Callable[[], None]):
+        """Register a callable invoked from the camera thread on each new frame"""
+        self._frame_listeners = self._frame_listeners + (listener,)
+    
+    def remove_frame_listener(self, listener: Callable[[], None]):
+        """Unregister a frame listener"""
+        self._frame_listeners = tuple(l for l in self._frame_listeners if l is not listener)
+    
+    def _publish_frame(self, frame: np.ndarray):
+        """Store a new frame and notify listeners"""
+        self.current_frame = frame
+        self.frame_count += 1
+        
+        for listener in self._frame_listeners:
+            try:
+                listener()
+            except Exception as e:
+                self.logger.error(f"Frame listener error: {e}")
+    
     def _run_simulation(self):
         """Run the camera simulation loop"""
         if Path(self.video_source).exists():
@@ -65,8 +87,7 @@ class CameraSimulator:
                 cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
                 continue
             
-            self.current_frame = frame
-            self.frame_count += 1
+            self._publish_frame(frame)
             time.sleep(self.frame_interval)
         
         cap.release()
@@ -95,8 +116,7 @@ class CameraSimulator:
             
             # No fake fire simulation in production
             
-            self.current_frame = frame
-            self.frame_count += 1
+            self._publish_frame(frame)
             time.sleep(self.frame_interval)
     
 
@@ -104,16 +124,29 @@ class MultiCameraSimulator:
     """Manages multiple simulated cameras"""
     
     def __init__(self):
-        self.cameras: List[CameraSimulator] = []
+        self.cameras_by_id: Dict[str, CameraSimulator] = {}
         self.logger = logging.getLogger(__name__)
     
+    @property
+    def cameras(self) -> Tuple[CameraSimulator, ...]:
+        """Snapshot of all cameras in insertion order, safe to iterate while cameras change"""
+        return tuple(self.cameras_by_id.values())
+    
     def add_camera(self, camera_id: str, video_source: str, fps: int = 30):
         """Add a camera to the simulation"""
         camera = CameraSimulator(camera_id, video_source, fps)
-        self.cameras.append(camera)
+        self.cameras_by_id[camera_id] = camera
         # Camera added
         return camera
     
+    def remove_camera(self, camera_id: str) -> bool:
+        """Stop and remove a camera from the simulation"""
+        camera = self.cameras_by_id.pop(camera_id, None)
+        if camera is None:
+            return False
+        camera.stop()
+        return True
+    
     def start_all(self):
         """Start all camera simulations"""
         for camera in self.cameras:
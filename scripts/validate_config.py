@@ -189,15 +189,22 @@ class ConfigValidator:
         
         for config_name, config_path in config_files.items():
             file_path = Path(config_path)
+            if config_name == 'cameras.yaml':
+                file_path = self._newest_camera_config(file_path)
             
             if file_path.exists():
                 try:
                     with open(file_path, 'r') as f:
-                        config_data = yaml.safe_load(f)
+                        if file_path.suffix == '.json':
+                            config_data = json.load(f)
+                        else:
+                            config_data = yaml.safe_load(f)
                     
                     self.config_files[config_name] = config_data
-                    self.info.append(f"✅ {config_name}: loaded successfully")
+                    self.info.append(f"✅ {config_name}: loaded successfully from {file_path}")
                     
+                except json.JSONDecodeError as e:
+                    self.errors.append(f"❌ {config_name}: invalid JSON in {file_path} - {e}")
                 except yaml.YAMLError as e:
                     self.errors.append(f"❌ {config_name}: invalid YAML syntax - {e}")
                 except Exception as e:
@@ -208,6 +215,16 @@ class ConfigValidator:
                 else:
                     self.warnings.append(f"⚠️  {config_name}: missing (will use defaults)")
     
+    @staticmethod
+    def _newest_camera_config(yaml_path: Path) -> Path:
+        """Pick the file the backend loads: the saved cameras.json unless the YAML is newer"""
+        json_path = yaml_path.with_suffix('.json')
+        if not json_path.exists():
+            return yaml_path
+        if yaml_path.exists() and yaml_path.stat().st_mtime > json_path.stat().st_mtime:
+            return yaml_path
+        return json_path
+    
     def _validate_detection_config(self):
         """Validate detection configuration"""
         print("🔍 Checking detection configuration...")
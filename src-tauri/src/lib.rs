@@ -301,7 +301,7 @@ async fn get_system_status(state: State<'_, AppState>) -> Result<SystemStatus, S
 async fn get_camera_frame(
     state: State<'_, AppState>,
     camera_id: String
-) -> Result<serde_json::Value, String> {
+) -> Result<tauri::ipc::Response, String> {
     let url = format!("{}/api/cameras/{}/frame", state.api_base_url, camera_id);
     
     let response = state.client
@@ -315,11 +315,12 @@ async fn get_camera_frame(
         return Err(format!("API error: {}", response.status()));
     }
 
-    let data: serde_json::Value = response.json()
+    // Raw JPEG bytes, handed to the frontend as an ArrayBuffer
+    let data = response.bytes()
         .await
-        .map_err(|e| format!("Failed to parse camera frame data: {}", e))?;
+        .map_err(|e| format!("Failed to read camera frame data: {}", e))?;
 
-    Ok(data)
+    Ok(tauri::ipc::Response::new(data.to_vec()))
 }
 
 #[tauri::command]
@@ -7,6 +7,7 @@ export const useCameraManager = () => {
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState(null);
   const frameUpdateRef = useRef(null);
+  const frameUrlsRef = useRef({});
   
   // Tauri commands
   const { execute: getCameraFeeds } = useTauriCommand('get_camera_feeds');
@@ -51,15 +52,21 @@ export const useCameraManager = () => {
     try {
       const frameData = await getCameraFrame({ camera_id: cameraId });
       
-      if (frameData && frameData.frame) {
-        const frameUrl = `data:image/jpeg;base64,${frameData.frame}`;
+      if (frameData && frameData.byteLength) {
+        const frameUrl = URL.createObjectURL(new Blob([frameData], { type: 'image/jpeg' }));
+        
+        // Release the previous frame for this camera
+        if (frameUrlsRef.current[cameraId]) {
+          URL.revokeObjectURL(frameUrlsRef.current[cameraId]);
+        }
+        frameUrlsRef.current[cameraId] = frameUrl;
         
         setFrames(current => ({
           ...current,
           [cameraId]: {
             url: frameUrl,
-            timestamp: frameData.timestamp,
-            cameraId: frameData.camera_id
+            timestamp: Date.now() / 1000,
+            cameraId
           }
         }));
         
@@ -208,6 +215,14 @@ export const useCameraManager = () => {
     };
   }, [cameras, startFrameUpdates, stopFrameUpdates]);
 
+  // Release frame object URLs on unmount
+  useEffect(() => {
+    const frameUrls = frameUrlsRef.current;
+    return () => {
+      Object.values(frameUrls).forEach(url => URL.revokeObjectURL(url));
+    };
+  }, []);
+
   // Get stats for summary display
   const getCameraStats = useCallback(() => {
     const online = cameras.filter(c => c.status === 'online').length;
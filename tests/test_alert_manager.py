@@ -0,0 +1,287 @@
+"""
+Tests for Alert Management System
+"""
+
+import pytest
+import time
+import threading
+import asyncio
+import sqlite3
+from types import SimpleNamespace
+from pathlib import Path
+import sys
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+from alerts.alert_manager import Alert, AlertLevel, AlertDatabase, AlertManager, LEGACY_APP_ALERTS_TABLE
+
+
+class TestAlertDatabase:
+    """Test cases for AlertDatabase"""
+
+    @pytest.fixture
+    def database(self, tmp_path):
+        """Create AlertDatabase backed by a temporary file"""
+        db = AlertDatabase(str(tmp_path / "alerts.db"))
+        yield db
+        db.close()
+
+    def make_alert(self, alert_id: str = "cam1_1", level: AlertLevel = AlertLevel.P2,
+                   confidence: float = 0.9, timestamp: float = None) -> Alert:
+        """Create a test alert"""
+        return Alert(
+            id=alert_id,
+            timestamp=timestamp if timestamp is not None else time.time(),
+            camera_id="cam1",
+            alert_level=level,
+            confidence=confidence,
+            detections=[{'confidence': confidence, 'bbox': [0, 0, 10, 10],
+                         'class_name': 'fire', 'timestamp': time.time()}]
+        )
+
+    def test_wal_mode_enabled(self, database):
+        """Test database is switched to WAL journaling"""
+        mode = database._get_conn().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_connection_reused_per_thread(self, database):
+        """Test each thread gets its own long-lived connection"""
+        assert database._get_conn() is database._get_conn()
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(database._get_conn()))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not database._get_conn()
+
+    def test_save_and_load_alert(self, database):
+        """Test alerts round-trip through the database"""
+        alert = self.make_alert()
+        assert database.save_alert(alert)
+
+        alerts = database.get_recent_alerts()
+        assert len(alerts) == 1
+        assert alerts[0].id == alert.id
+        assert alerts[0].alert_level == AlertLevel.P2
+        assert alerts[0].detections[0]['class_name'] == 'fire'
+
+    def test_alert_statistics(self, database):
+        """Test per-level statistics"""
+        database.save_alert(self.make_alert("cam1_1", AlertLevel.P1, 0.96))
+        database.save_alert(self.make_alert("cam1_2", AlertLevel.P2, 0.86))
+        database.save_alert(self.make_alert("cam1_3", AlertLevel.P2, 0.88))
+
+        stats = database.get_alert_statistics()
+        assert stats['total'] == 3
+        assert stats['P1']['count'] == 1
+        assert stats['P2']['count'] == 2
+        assert stats['P2']['avg_confidence'] == pytest.approx(0.87)
+
+    def test_statistics_window_exact(self, database):
+        """Test statistics cut off at the window start, not at the start of its hour"""
+        cutoff = time.time() - 24 * 3600
+        # Inside the hour the window starts in, but before the cutoff
+        database.save_alert(self.make_alert("cam1_before", timestamp=(cutoff // 3600) * 3600))
+        database.save_alert(self.make_alert("cam1_after", timestamp=cutoff + 60))
+        database.save_alert(self.make_alert("cam1_now"))
+
+        stats = database.get_alert_statistics(hours=24)
+        assert stats['total'] == 2
+        assert stats['total'] == len(database.get_alert_summaries(hours=24))
+
+    def test_cleanup_old_records(self, database):
+        """Test records older than the retention window are removed"""
+        database.save_alert(self.make_alert("cam1_old", timestamp=time.time() - 40 * 24 * 3600))
+        database.save_alert(self.make_alert("cam1_new"))
+
+        database.cleanup_old_records(retention_days=30)
+
+        alerts = database.get_recent_alerts(hours=24 * 60)
+        assert [a.id for a in alerts] == ["cam1_new"]
+
+    def test_save_alerts_batch(self, database):
+        """Test a batch of alerts is written in one call"""
+        batch = [self.make_alert(f"cam1_{i}") for i in range(10)]
+        assert database.save_alerts(batch)
+
+        assert len(database.get_recent_alerts()) == 10
+
+    def test_active_alert_count(self, database):
+        """Test active alert count uses status and time window"""
+        database.save_alert(self.make_alert("cam1_1"))
+        database.save_alert(self.make_alert("cam1_2"))
+        database.save_alert(self.make_alert("cam1_old", timestamp=time.time() - 48 * 3600))
+        database._get_conn().execute("UPDATE alerts SET status = 'acknowledged' WHERE id = 'cam1_2'")
+
+        assert database.get_active_alert_count(hours=24) == 1
+
+        plan = database._get_conn().execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM alerts WHERE status = 'active' AND timestamp > 0"
+        ).fetchall()
+        assert any('idx_alerts_status_ts' in row[3] for row in plan)
+
+    def test_alert_summaries(self, database):
+        """Test dashboard rows are projected without detection details"""
+        alert = self.make_alert("cam1_1", AlertLevel.P1, 0.97)
+        alert.frame_path = "data/alert_frames/cam1_1.jpg"
+        database.save_alert(alert)
+        database.save_alert(self.make_alert("cam1_2", timestamp=alert.timestamp - 10))
+
+        rows = database.get_alert_summaries()
+        assert [r.id for r in rows] == ["cam1_1", "cam1_2"]
+        assert rows[0].alert_level == "P1"
+        assert rows[0].has_frame is True
+        assert rows[1].has_frame is False
+        assert 'detections' not in rows[0]._fields
+
+        assert database.get_last_detection_time() == alert.timestamp
+
+    def test_last_detection_time_window(self, database):
+        """Test the last detection time only considers alerts within the window"""
+        old = time.time() - 48 * 3600
+        database.save_alert(self.make_alert("cam1_old", timestamp=old))
+
+        assert database.get_last_detection_time() is None
+        assert database.get_last_detection_time(hours=72) == old
+
+    def test_statistics_rollup_not_double_counted(self, database):
+        """Test re-saving an alert (e.g. with its frame path) keeps stats unchanged"""
+        alert = self.make_alert("cam1_1", AlertLevel.P1, 0.96)
+        database.save_alert(alert)
+        alert.frame_path = "data/alert_frames/cam1_1.jpg"
+        database.save_alert(alert)
+
+        stats = database.get_alert_statistics()
+        assert stats['total'] == 1
+        assert stats['P1'] == {'count': 1, 'avg_confidence': 0.96}
+
+    def test_get_alert_by_id(self, database):
+        """Test single alerts are looked up by primary key"""
+        database.save_alert(self.make_alert("cam1_1", AlertLevel.P1, 0.96))
+
+        alert = database.get_alert("cam1_1")
+        assert alert.id == "cam1_1"
+        assert alert.alert_level == AlertLevel.P1
+        assert database.get_alert("missing") is None
+
+    def test_async_reads(self, database):
+        """Test async wrappers return the same data as the sync API"""
+        database.save_alert(self.make_alert("cam1_1"))
+
+        alerts = asyncio.run(database.aget_recent_alerts())
+        stats = asyncio.run(database.aget_alert_statistics())
+
+        assert [a.id for a in alerts] == ["cam1_1"]
+        assert stats['total'] == 1
+
+    def test_moves_app_alerts_table_aside(self, tmp_path):
+        """Test the app notification store's alerts table in a shared file is renamed, not reused"""
+        path = tmp_path / "alerts.db"
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE alerts (alert_id TEXT PRIMARY KEY, timestamp INTEGER) WITHOUT ROWID")
+        conn.execute("INSERT INTO alerts VALUES ('app_1', 1)")
+        conn.commit()
+        conn.close()
+
+        database = AlertDatabase(str(path))
+        assert database.save_alert(self.make_alert())
+        assert [a.id for a in database.get_recent_alerts()] == ["cam1_1"]
+        legacy = database._get_conn().execute(f"SELECT alert_id FROM {LEGACY_APP_ALERTS_TABLE}").fetchall()
+        assert legacy == [("app_1",)]
+        database.close()
+
+    def test_unknown_alerts_layout_rejected(self, tmp_path):
+        """Test a file whose alerts table matches neither store fails to open"""
+        path = tmp_path / "alerts.db"
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE alerts (name TEXT)")
+        conn.close()
+
+        with pytest.raises(RuntimeError):
+            AlertDatabase(str(path))
+
+    def test_system_events_buffered_until_flush(self, database):
+        """Test system events are written in one batch on flush"""
+        conn = database._get_conn()
+        for i in range(3):
+            database.log_system_event("INFO", f"event {i}", "Test", {'n': i})
+        assert conn.execute("SELECT COUNT(*) FROM system_logs").fetchone()[0] == 0
+
+        database.flush_system_events()
+
+        rows = conn.execute("SELECT message, json(data) FROM system_logs ORDER BY id").fetchall()
+        assert rows == [("event 0", '{"n":0}'), ("event 1", '{"n":1}'), ("event 2", '{"n":2}')]
+
+
+class TestAlertManager:
+    """Test cases for AlertManager"""
+
+    @pytest.fixture
+    def alert_manager(self, tmp_path, monkeypatch):
+        """Create AlertManager with its database in a temporary directory"""
+        monkeypatch.chdir(tmp_path)
+        manager = AlertManager()
+        yield manager
+        manager.stop()
+
+    def test_alert_ids_unique_within_millisecond(self, alert_manager):
+        """Test back-to-back alerts from one camera get distinct IDs"""
+        ids = [alert_manager._next_alert_id("cam1") for _ in range(100)]
+        assert len(set(ids)) == 100
+        assert all(i.startswith("cam1_") for i in ids)
+
+    def test_created_alerts_are_persisted(self, alert_manager):
+        """Test queued alerts are written by the background thread"""
+        detection = SimpleNamespace(confidence=0.9, bbox=(0, 0, 10, 10),
+                                    class_name='fire', timestamp=time.time())
+        result = SimpleNamespace(alert_level='P2', timestamp=time.time(),
+                                 max_confidence=0.9, detections=[detection])
+
+        created = [alert_manager.create_alert("cam1", result) for _ in range(5)]
+
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            if len(alert_manager.database.get_recent_alerts()) == 5:
+                break
+            time.sleep(0.05)
+
+        stored = {a.id for a in alert_manager.database.get_recent_alerts()}
+        assert stored == {a.id for a in created}
+
+    def test_get_alert_served_from_cache(self, alert_manager):
+        """Test created alerts are found by ID without a database read"""
+        detection = SimpleNamespace(confidence=0.9, bbox=(0, 0, 10, 10),
+                                    class_name='fire', timestamp=time.time())
+        result = SimpleNamespace(alert_level='P2', timestamp=time.time(),
+                                 max_confidence=0.9, detections=[detection])
+
+        created = alert_manager.create_alert("cam1", result)
+        assert alert_manager.get_alert(created.id) is created
+        assert asyncio.run(alert_manager.aget_alert(created.id)) is created
+
+        alert_manager.database.save_alert(created)
+        assert alert_manager.acknowledge_alert(created.id)
+        assert alert_manager.get_alert(created.id).status == 'acknowledged'
+        assert alert_manager.get_alert("missing") is None
+
+    def test_notification_events_written_by_stop(self, tmp_path, monkeypatch):
+        """Test events logged while dispatching notifications are flushed before stop returns"""
+        monkeypatch.chdir(tmp_path)
+        manager = AlertManager()
+        detection = SimpleNamespace(confidence=0.97, bbox=(0, 0, 10, 10),
+                                    class_name='fire', timestamp=time.time())
+        result = SimpleNamespace(alert_level='P1', timestamp=time.time(),
+                                 max_confidence=0.97, detections=[detection])
+
+        created = [manager.create_alert("cam1", result) for _ in range(3)]
+        manager.stop()
+
+        database = AlertDatabase(str(manager.database.db_path))
+        rows = database._get_conn().execute(
+            "SELECT json_extract(data, '$.alert_id') FROM system_logs WHERE level = 'CRITICAL'"
+        ).fetchall()
+        database.close()
+        assert sorted(row[0] for row in rows) == sorted(a.id for a in created)
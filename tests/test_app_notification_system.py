@@ -0,0 +1,258 @@
+"""
+Tests for App Notification System
+"""
+
+import pytest
+import base64
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+pytest.importorskip("cv2")
+pytest.importorskip("numpy")
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+from alerts.app_notification_system import (
+    AlertMessage, AlertDatabase, AppAlertConfig, AppNotificationManager, SCHEMA_VERSION
+)
+from alerts.alert_manager import LEGACY_APP_ALERTS_TABLE
+
+
+def make_alert(alert_id: str = "cam1_1", alert_type: str = "P2",
+               timestamp: datetime = None, image_data: bytes = None) -> AlertMessage:
+    """Create a test alert"""
+    return AlertMessage(
+        alert_id=alert_id,
+        alert_type=alert_type,
+        camera_id="cam1",
+        message="Fire detected",
+        confidence=0.9,
+        timestamp=timestamp or datetime.now(),
+        image_data=image_data
+    )
+
+
+LEGACY_TIMESTAMP = datetime(2024, 5, 1, 12, 30, 15, 250000)
+LEGACY_ACKNOWLEDGED_AT = datetime(2024, 5, 1, 12, 35)
+LEGACY_IMAGE = b"\xff\xd8legacy frame"
+
+
+def create_legacy_alerts(path: Path, table: str = "alerts"):
+    """Write two alerts in the unversioned layout (rowid, ISO timestamps, base64 frame in data)"""
+    conn = sqlite3.connect(path)
+    conn.execute(f"""
+        CREATE TABLE {table} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            alert_id TEXT UNIQUE NOT NULL,
+            alert_type TEXT NOT NULL,
+            camera_id TEXT NOT NULL,
+            message TEXT NOT NULL,
+            confidence REAL NOT NULL,
+            timestamp TIMESTAMP NOT NULL,
+            location TEXT,
+            frame_path TEXT,
+            acknowledged BOOLEAN DEFAULT FALSE,
+            acknowledged_by TEXT,
+            acknowledged_at TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            data JSON
+        )
+    """)
+    conn.execute(f"""
+        INSERT INTO {table} (alert_id, alert_type, camera_id, message, confidence, timestamp,
+                             location, acknowledged, acknowledged_by, acknowledged_at, data)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, ("cam1_1", "P1", "cam1", "Fire detected", 0.95, LEGACY_TIMESTAMP.isoformat(), "Warehouse",
+          True, "operator", LEGACY_ACKNOWLEDGED_AT.isoformat(),
+          json.dumps({'image_data': base64.b64encode(LEGACY_IMAGE).decode('ascii')})))
+    conn.execute(f"""
+        INSERT INTO {table} (alert_id, alert_type, camera_id, message, confidence, timestamp, data)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, ("cam1_2", "P2", "cam1", "Smoke detected", 0.85, LEGACY_TIMESTAMP.isoformat(), json.dumps({})))
+    conn.commit()
+    conn.close()
+
+
+def assert_legacy_alerts_migrated(database: AlertDatabase):
+    """Check the two legacy alerts were rebuilt in the current layout"""
+    conn = database._get_conn()
+
+    sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'alerts'").fetchone()[0]
+    assert "WITHOUT ROWID" in sql
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+    rows = conn.execute("SELECT alert_id, timestamp, image_data FROM alerts ORDER BY alert_id").fetchall()
+    expected_us = int(LEGACY_TIMESTAMP.timestamp() * 1_000_000)
+    assert [tuple(row) for row in rows] == [("cam1_1", expected_us, LEGACY_IMAGE), ("cam1_2", expected_us, None)]
+
+    migrated = database.get_alert("cam1_1")
+    assert migrated.timestamp == LEGACY_TIMESTAMP
+    assert migrated.image_data == LEGACY_IMAGE
+    assert migrated.location == "Warehouse"
+    assert migrated.acknowledged_at == LEGACY_ACKNOWLEDGED_AT
+
+
+class TestAlertDatabase:
+    """Test cases for AlertDatabase"""
+
+    @pytest.fixture
+    def database(self, tmp_path):
+        """Create AlertDatabase backed by a temporary file"""
+        db = AlertDatabase(str(tmp_path / "app_alerts.db"))
+        yield db
+        db.close()
+
+    def test_new_database_versioned(self, database):
+        """Test a fresh database gets the current layout and user_version"""
+        conn = database._get_conn()
+        sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'alerts'").fetchone()[0]
+        assert "WITHOUT ROWID" in sql
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+    def test_save_and_load_alert(self, database):
+        """Test alerts and their image data round-trip through the database"""
+        alert = make_alert(image_data=b"\xff\xd8jpeg")
+        assert database.save_alert(alert)
+
+        loaded = database.get_alert("cam1_1")
+        assert loaded.timestamp == alert.timestamp
+        assert loaded.image_data == b"\xff\xd8jpeg"
+        assert database.get_alert("cam1_1", include_image=False).image_data is None
+
+    def test_duplicate_alert_in_batch(self, database):
+        """Test a duplicate alert_id is skipped without rolling back the rest of the batch"""
+        batch = [make_alert("cam1_1"), make_alert("cam1_1"), make_alert("cam1_2")]
+
+        assert database.save_alerts_batch(batch) == [True, False, True]
+
+        alerts = database.get_recent_alerts()
+        assert sorted(a.alert_id for a in alerts) == ["cam1_1", "cam1_2"]
+        count = database._get_conn().execute("SELECT SUM(count) FROM alert_stats").fetchone()[0]
+        assert count == 2
+
+    def test_read_cache_invalidated_by_writes(self, database):
+        """Test cached dashboard reads are refreshed after a save or acknowledgement"""
+        database.save_alert(make_alert("cam1_1", "P1"))
+        assert database.get_unacknowledged_count()['P1'] == 1
+        assert len(database.get_recent_alerts()) == 1
+
+        database.save_alert(make_alert("cam1_2", "P1"))
+        assert database.get_unacknowledged_count()['P1'] == 2
+        assert len(database.get_recent_alerts()) == 2
+
+        assert database.acknowledge_alert("cam1_1")
+        assert database.get_unacknowledged_count()['P1'] == 1
+        acknowledged = database.get_alert("cam1_1")
+        assert acknowledged.acknowledged
+        assert acknowledged.acknowledged_by == "operator"
+
+    def test_cleanup_old_alerts(self, database, tmp_path):
+        """Test old alerts and their frame files are removed"""
+        frame = tmp_path / "cam1_old.jpg"
+        frame.write_bytes(b"jpeg")
+        old = make_alert("cam1_old", timestamp=datetime.now() - timedelta(days=40))
+        database.save_alert(old, str(frame))
+        database.save_alert(make_alert("cam1_new"))
+
+        database.cleanup_old_alerts(retention_days=30)
+
+        assert [a.alert_id for a in database.get_recent_alerts(hours=24 * 60)] == ["cam1_new"]
+        assert not frame.exists()
+
+        # The scratch table is reused and left empty between runs
+        database.cleanup_old_alerts(retention_days=30)
+        assert database._get_conn().execute("SELECT COUNT(*) FROM cleanup_ids").fetchone()[0] == 0
+
+    def test_migrates_legacy_schema(self, tmp_path):
+        """Test an unversioned rowid table with ISO timestamps is rebuilt in the current layout"""
+        path = tmp_path / "app_alerts.db"
+        create_legacy_alerts(path)
+
+        database = AlertDatabase(str(path))
+        assert_legacy_alerts_migrated(database)
+        database.close()
+
+        # Reopening a migrated file leaves it alone
+        database = AlertDatabase(str(path))
+        assert len(database.get_recent_alerts(hours=24 * 365 * 100)) == 2
+        database.close()
+
+    @pytest.mark.parametrize("table", ["alerts", LEGACY_APP_ALERTS_TABLE])
+    def test_copies_alerts_from_shared_file(self, tmp_path, table):
+        """Test alerts kept in the old shared alerts.db are copied into a new store file"""
+        legacy_path = tmp_path / "alerts.db"
+        create_legacy_alerts(legacy_path, table)
+        conn = sqlite3.connect(legacy_path)
+        conn.execute("CREATE TABLE alert_stats (hour_key TEXT, day_key TEXT, alert_type TEXT, count INTEGER)")
+        conn.execute("INSERT INTO alert_stats VALUES ('2024-05-01-12', '2024-05-01', 'P1', 1)")
+        conn.commit()
+        conn.close()
+
+        database = AlertDatabase(str(tmp_path / "app_alerts.db"), str(legacy_path))
+        assert_legacy_alerts_migrated(database)
+        assert database._get_conn().execute("SELECT SUM(count) FROM alert_stats").fetchone()[0] == 1
+        database.close()
+
+        # The shared file is left as it was
+        conn = sqlite3.connect(legacy_path)
+        assert conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == 2
+        conn.close()
+
+    def test_foreign_alerts_layout_rejected(self, tmp_path):
+        """Test a file whose alerts table belongs to another store fails to open"""
+        path = tmp_path / "app_alerts.db"
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE alerts (id TEXT PRIMARY KEY, alert_level TEXT, status TEXT)")
+        conn.close()
+
+        with pytest.raises(RuntimeError):
+            AlertDatabase(str(path))
+
+
+class TestAppNotificationManager:
+    """Test cases for AppNotificationManager"""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        """Keep the manager's database and frames in a temporary directory"""
+        return AppAlertConfig(
+            database_path=str(tmp_path / "app_alerts.db"),
+            legacy_database_path=str(tmp_path / "alerts.db"),
+            alert_frames_dir=str(tmp_path / "alert_frames")
+        )
+
+    def stored_ids(self, config: AppAlertConfig):
+        """Read back the alert IDs persisted by a stopped manager"""
+        database = AlertDatabase(config.database_path)
+        ids = sorted(a.alert_id for a in database.get_recent_alerts())
+        database.close()
+        return ids
+
+    def test_queued_alerts_saved_on_stop(self, config):
+        """Test alerts sent right before stop_processing are persisted, not dropped"""
+        manager = AppNotificationManager(config)
+        for i in range(5):
+            manager.send_fire_alert(make_alert(f"cam1_{i}"))
+        manager.stop_processing()
+
+        assert self.stored_ids(config) == [f"cam1_{i}" for i in range(5)]
+
+    def test_queue_drained_without_processor(self, config, monkeypatch):
+        """Test stop_processing writes the queue itself when the processor isn't there to"""
+        monkeypatch.setattr(AppNotificationManager, 'start_processing', lambda self: None)
+        manager = AppNotificationManager(config)
+        received = []
+        manager.register_callback(received.append)
+
+        for i in range(3):
+            manager.send_fire_alert(make_alert(f"cam1_{i}"))
+        manager.stop_processing()
+
+        assert not manager.alert_queue
+        assert self.stored_ids(config) == ["cam1_0", "cam1_1", "cam1_2"]
+        assert [a.alert_id for a in received] == ["cam1_0", "cam1_1", "cam1_2"]
@@ -0,0 +1,166 @@
+"""
+Tests for Camera Configuration Management
+"""
+
+import pytest
+import os
+import time
+import yaml
+import orjson
+from pathlib import Path
+import sys
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+from config.camera_config import CameraConfigManager, CameraProfile
+
+
+def make_profile(camera_id: str = "cam1", name: str = "Front Door") -> CameraProfile:
+    """Create a test camera profile"""
+    return CameraProfile(
+        camera_id=camera_id,
+        name=name,
+        rtsp_url=f"rtsp://192.168.1.10:554/{camera_id}",
+        username="admin",
+        password="secret",
+        detection_zones=[[(0, 0), (100, 0), (100, 100)]]
+    )
+
+
+class TestCameraProfile:
+    """Test cases for CameraProfile"""
+
+    def test_to_dict_cached_until_field_changes(self):
+        """Test the serialized dict is reused and rebuilt after an assignment"""
+        profile = make_profile()
+        first = profile.to_dict()
+        assert profile.to_dict() is first
+        assert first['resolution'] == [1920, 1080]
+        assert first['detection_zones'] == [[[0, 0], [100, 0], [100, 100]]]
+
+        profile.name = "Back Door"
+        assert profile.to_dict() is not first
+        assert profile.to_dict()['name'] == "Back Door"
+
+
+class TestCameraConfigManager:
+    """Test cases for CameraConfigManager"""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Create CameraConfigManager with its config in a temporary directory"""
+        manager = CameraConfigManager(str(tmp_path / "cameras.yaml"))
+        yield manager
+        manager.flush()
+
+    def test_change_saved_immediately(self, manager):
+        """Test a single change is on disk when the call returns"""
+        assert manager.add_camera(make_profile())
+
+        data = orjson.loads(manager.json_config_file.read_bytes())
+        assert [c['camera_id'] for c in data['cameras']] == ["cam1"]
+
+        assert manager.remove_camera("cam1")
+        assert orjson.loads(manager.json_config_file.read_bytes())['cameras'] == []
+
+    def test_failed_save_reported(self, manager):
+        """Test a single change reports a failed write instead of claiming success"""
+        # A directory in place of the JSON file makes the write fail
+        manager.json_config_file.mkdir(parents=True)
+
+        assert not manager.add_camera(make_profile())
+        assert not manager.update_camera("cam1", fps=5)
+        assert manager._dirty
+
+        manager.json_config_file.rmdir()
+        assert manager.remove_camera("cam1")
+        assert not manager._dirty
+
+    def test_batch_writes_once(self, manager, monkeypatch):
+        """Test changes made inside batch() are saved in a single write on exit"""
+        saves = []
+        original = manager.save_config
+        monkeypatch.setattr(manager, 'save_config', lambda: saves.append(1) or original())
+
+        with manager.batch():
+            for i in range(5):
+                manager.add_camera(make_profile(f"cam{i}"))
+            manager.update_camera("cam0", enabled=False)
+            assert saves == []
+
+        assert saves == [1]
+        data = orjson.loads(manager.json_config_file.read_bytes())
+        assert len(data['cameras']) == 5
+
+    def test_flush_round_trip(self, manager, tmp_path):
+        """Test flushed cameras are loaded back by a new manager"""
+        manager.add_camera(make_profile("cam1"))
+        manager.add_camera(make_profile("cam2", "Garage"))
+        manager.update_camera("cam2", enabled=False, fps=10)
+        assert manager.flush()
+
+        reloaded = CameraConfigManager(str(tmp_path / "cameras.yaml"))
+        assert set(reloaded.cameras) == {"cam1", "cam2"}
+        assert reloaded.get_camera("cam2").fps == 10
+        assert reloaded.get_camera("cam2").to_dict() == manager.get_camera("cam2").to_dict()
+        assert list(reloaded.get_enabled_cameras()) == ["cam1"]
+
+    def test_failed_flush_keeps_changes_pending(self, manager):
+        """Test a failed save at the end of a batch leaves the config dirty so it is retried"""
+        # A directory in place of the JSON file makes the write fail
+        manager.json_config_file.mkdir(parents=True)
+        with manager.batch():
+            assert manager.add_camera(make_profile())
+
+        assert manager._dirty
+        assert not manager.flush()
+
+        manager.json_config_file.rmdir()
+        assert manager.flush()
+        assert not manager._dirty
+        assert manager.json_config_file.exists()
+
+    def test_config_file_private(self, manager):
+        """Test the saved config, which holds camera credentials, is owner-only"""
+        manager.add_camera(make_profile())
+        manager.flush()
+        assert manager.json_config_file.stat().st_mode & 0o777 == 0o600
+
+        export_path = manager.export_config(str(manager.config_file.parent / "export.yaml"))
+        assert os.stat(export_path).st_mode & 0o777 == 0o600
+
+    def test_yaml_used_when_newer_than_json(self, tmp_path):
+        """Test the JSON config is preferred unless the YAML file was edited after it"""
+        yaml_path = tmp_path / "cameras.yaml"
+        json_path = tmp_path / "cameras.json"
+        json_path.write_bytes(orjson.dumps({'cameras': [make_profile("from_json").to_dict()]}))
+        yaml_path.write_text(yaml.dump({'cameras': [make_profile("from_yaml").to_dict()]}))
+
+        os.utime(yaml_path, (1000, 1000))
+        assert list(CameraConfigManager(str(yaml_path)).cameras) == ["from_json"]
+
+        os.utime(yaml_path, (time.time() + 10, time.time() + 10))
+        assert list(CameraConfigManager(str(yaml_path)).cameras) == ["from_yaml"]
+
+    def test_discovery_cache(self, manager, monkeypatch):
+        """Test repeat scans of the same ranges reuse the saved result"""
+        scans = []
+        device = {'ip': '10.9.8.1', 'port': 554, 'rtsp_url': 'rtsp://10.9.8.1:554/stream1'}
+
+        def scan_ports(targets, timeout):
+            scans.append(targets)
+            return [('10.9.8.1', 554)]
+
+        monkeypatch.setattr(manager, '_scan_ports_batch', scan_ports)
+        monkeypatch.setattr(manager, '_probe_rtsp_paths', lambda ip, port, paths, timeout: dict(device))
+
+        assert manager.discover_network_cameras(['10.9.8.0/30'], use_onvif=False) == [device]
+        assert manager.discover_network_cameras(['10.9.8.0/30'], use_onvif=False) == [device]
+        assert len(scans) == 1
+
+        # Different ranges or an explicit rescan go to the network
+        manager.discover_network_cameras(['10.9.7.0/30'], use_onvif=False)
+        manager.discover_network_cameras(['10.9.8.0/30'], use_onvif=False, use_cache=False)
+        assert len(scans) == 3
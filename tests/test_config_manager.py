@@ -0,0 +1,62 @@
+"""
+Tests for Configuration Management System
+"""
+
+import pytest
+import os
+import yaml
+from pathlib import Path
+import sys
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+from config.config_manager import ConfigManager
+
+
+class TestConfigManager:
+    """Test cases for ConfigManager"""
+
+    # Fixed mtime standing in for a filesystem with coarse timestamps
+    MTIME = 1_700_000_000
+
+    @pytest.fixture
+    def config_path(self, tmp_path):
+        """Write a detection config as yaml.dump would, so rewrites keep its size"""
+        path = tmp_path / "detection_config.yaml"
+        path.write_text(yaml.dump({
+            'detection': {'thresholds': {'immediate_alert': 0.95, 'review_queue': 0.85, 'log_only': 0.7}}
+        }, default_flow_style=False, indent=2))
+        os.utime(path, (self.MTIME, self.MTIME))
+        return path
+
+    def test_loads_thresholds(self, config_path):
+        """Test thresholds are read from the config file"""
+        detection = ConfigManager(str(config_path)).get_detection_config()
+        assert (detection.immediate_alert, detection.review_queue, detection.log_only) == (0.95, 0.85, 0.7)
+
+    def test_consecutive_updates_kept(self, config_path):
+        """Test back-to-back updates that leave mtime and size unchanged don't drop each other"""
+        manager = ConfigManager(str(config_path))
+
+        assert manager.update_threshold('immediate_alert', 0.96)
+        os.utime(config_path, (self.MTIME, self.MTIME))
+        assert manager.update_threshold('review_queue', 0.86)
+        os.utime(config_path, (self.MTIME, self.MTIME))
+
+        thresholds = yaml.safe_load(config_path.read_text())['detection']['thresholds']
+        assert thresholds == {'immediate_alert': 0.96, 'review_queue': 0.86, 'log_only': 0.7}
+
+        detection = manager.get_detection_config()
+        assert (detection.immediate_alert, detection.review_queue) == (0.96, 0.86)
+        assert ConfigManager(str(config_path)).get_detection_config().immediate_alert == 0.96
+
+    def test_invalid_update_rejected(self, config_path):
+        """Test an update that breaks threshold ordering leaves the file unchanged"""
+        manager = ConfigManager(str(config_path))
+        before = config_path.read_text()
+
+        assert not manager.update_threshold('log_only', 0.99)
+        assert config_path.read_text() == before
+        assert manager.get_detection_config().log_only == 0.7